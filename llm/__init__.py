@@ -1,9 +1,17 @@
 """LLM integration modules for extraction and analysis."""
 
 from .analyzer import InvestmentAnalyzer
-from .extractor import OllamaExtractor
 
 __all__ = [
     "OllamaExtractor",
     "InvestmentAnalyzer",
 ]
+
+
+def __getattr__(name):
+    """Import the Ollama extractor on first access (only needed when LLM is enabled)."""
+    if name == "OllamaExtractor":
+        from .extractor import OllamaExtractor
+
+        return OllamaExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
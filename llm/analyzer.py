@@ -1,6 +1,7 @@
 """Investment analysis for apartment listings."""
 
 import logging
+from bisect import bisect_right
 from typing import Any, Dict, List, Optional, Tuple
 
 from models.apartment import ApartmentListing
@@ -8,13 +9,30 @@ from models.constants import (
     MRG_BUILDING_CUTOFF_YEAR,
     RECOMMENDATION_THRESHOLDS,
     RENT_PER_SQM_DEFAULTS,
-    VIENNA_DISTRICTS,
+    VIENNA_DISTRICT_MULTIPLIERS,
     VIENNA_PRICE_PER_SQM,
     InvestmentRecommendation,
 )
 
 logger = logging.getLogger(__name__)
 
+# Condition and energy rating groups used for scoring and filtering
+_GOOD_CONDITIONS = frozenset({"erstbezug", "saniert", "neuwertig", "sehr_gut"})
+_BAD_CONDITIONS = frozenset({"renovierungsbedurftig"})
+_EFFICIENT_ENERGY_RATINGS = frozenset({"A++", "A+", "A", "B"})
+_POOR_ENERGY_RATINGS = frozenset({"F", "G"})
+
+# Recommendation score bands sorted by lower bound, for bisect lookup
+_RECOMMENDATION_BANDS: Tuple[Tuple[float, float, InvestmentRecommendation], ...] = tuple(
+    sorted(
+        (min_score, max_score, recommendation)
+        for recommendation, (min_score, max_score) in RECOMMENDATION_THRESHOLDS.items()
+    )
+)
+_RECOMMENDATION_LOWER_BOUNDS: Tuple[float, ...] = tuple(
+    band[0] for band in _RECOMMENDATION_BANDS
+)
+
 
 class InvestmentAnalyzer:
     """Analyzer for apartment investment potential."""
@@ -88,8 +106,9 @@ class InvestmentAnalyzer:
         if not apartment.size_sqm:
             return
 
-        # Determine base rent per sqm
-        if apartment.city and apartment.city.lower() == "wien":
+        # Determine base rent per sqm (city lowered once for both lookups)
+        city = apartment.city.lower() if apartment.city else None
+        if city == "wien":
             if apartment.district_number:
                 if apartment.district_number <= 9:
                     base_rent = self.rent_estimates.get(
@@ -101,17 +120,15 @@ class InvestmentAnalyzer:
                     )
 
                 # Apply district multiplier
-                if apartment.district_number in VIENNA_DISTRICTS:
-                    multiplier = VIENNA_DISTRICTS[apartment.district_number][
-                        "multiplier"
-                    ]
+                multiplier = VIENNA_DISTRICT_MULTIPLIERS.get(apartment.district_number)
+                if multiplier is not None:
                     base_rent *= multiplier
             else:
                 base_rent = self.rent_estimates.get(
                     "vienna_outer", RENT_PER_SQM_DEFAULTS["vienna_outer"]
                 )
-        elif apartment.city:
-            city_key = apartment.city.lower().replace(" ", "_")
+        elif city:
+            city_key = city.replace(" ", "_")
             base_rent = self.rent_estimates.get(
                 city_key,
                 self.rent_estimates.get("default", RENT_PER_SQM_DEFAULTS["default"]),
@@ -202,22 +219,19 @@ class InvestmentAnalyzer:
 
         # === Condition (up to +0.5) ===
         if apartment.condition:
-            good_conditions = ["erstbezug", "saniert", "neuwertig", "sehr_gut"]
-            bad_conditions = ["renovierungsbedurftig"]
-
-            if apartment.condition in good_conditions:
+            if apartment.condition in _GOOD_CONDITIONS:
                 score += 0.5
                 positive_factors.append(f"Guter Zustand: {apartment.condition}")
-            elif apartment.condition in bad_conditions:
+            elif apartment.condition in _BAD_CONDITIONS:
                 score -= 1.0
                 risk_factors.append("Renovierung erforderlich")
 
         # === Energy efficiency (up to +0.5) ===
         if apartment.energy_rating:
-            if apartment.energy_rating in ["A++", "A+", "A", "B"]:
+            if apartment.energy_rating in _EFFICIENT_ENERGY_RATINGS:
                 score += 0.5
                 positive_factors.append(f"Energieeffizient ({apartment.energy_rating})")
-            elif apartment.energy_rating in ["F", "G"]:
+            elif apartment.energy_rating in _POOR_ENERGY_RATINGS:
                 score -= 0.5
                 risk_factors.append(
                     f"Schlechte Energieeffizienz ({apartment.energy_rating})"
@@ -281,8 +295,11 @@ class InvestmentAnalyzer:
 
     def _get_recommendation(self, score: float) -> InvestmentRecommendation:
         """Get recommendation based on score."""
-        for recommendation, (min_score, max_score) in RECOMMENDATION_THRESHOLDS.items():
-            if min_score <= score < max_score:
+        # Band with the highest lower bound <= score
+        index = bisect_right(_RECOMMENDATION_LOWER_BOUNDS, score) - 1
+        if index >= 0:
+            _, max_score, recommendation = _RECOMMENDATION_BANDS[index]
+            if score < max_score:
                 return recommendation
 
         # Default to CONSIDER if score is exactly at boundary
@@ -347,7 +364,7 @@ class InvestmentAnalyzer:
 
         # Energy filter
         if filters.get("exclude_poor_energy"):
-            if apartment.energy_rating in ["F", "G"]:
+            if apartment.energy_rating in _POOR_ENERGY_RATINGS:
                 return False, f"Poor energy rating: {apartment.energy_rating}"
 
         # Score filter
@@ -7,8 +7,85 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from utils import json_utils
+
 logger = logging.getLogger(__name__)
 
+# LLM response parsing (see _parse_json_response strategies)
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+_UNQUOTED_KEY_RE = re.compile(r'(\{|,)\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:')
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_KEY_VALUE_PATTERNS = [
+    (re.compile(r'"([^"]+)"\s*:\s*"([^"]*)"', re.IGNORECASE), str),
+    (re.compile(r'"([^"]+)"\s*:\s*(\d+\.?\d*)', re.IGNORECASE), float),
+    (re.compile(r'"([^"]+)"\s*:\s*(true|false)', re.IGNORECASE), lambda x: x.lower() == 'true'),
+    (re.compile(r'"([^"]+)"\s*:\s*null', re.IGNORECASE), lambda x: None),
+]
+
+# HTML preprocessing for the prompt. Block bodies use a tempered token
+# ("anything but the closing tag") instead of DOTALL ``.*?``, which scans
+# each body once instead of retrying the close-tag match at every character
+_JSON_LD_BLOCK_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>'
+    r'[^<]*(?:<(?!/script>)[^<]*)*</script>',
+    re.IGNORECASE,
+)
+_SCRIPT_BLOCK_RE = re.compile(
+    r'<script[^>]*>[^<]*(?:<(?!/script>)[^<]*)*</script>', re.IGNORECASE
+)
+_STYLE_BLOCK_RE = re.compile(
+    r'<style[^>]*>[^<]*(?:<(?!/style>)[^<]*)*</style>', re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+_INTER_TAG_SPACE_RE = re.compile(r'>\s+<')
+_PRIORITY_SECTION_PATTERNS = [
+    _JSON_LD_BLOCK_RE,
+    re.compile(r'<table[^>]*>[^<]*(?:<(?!/table>)[^<]*)*</table>', re.IGNORECASE),  # Tables often have costs
+    re.compile(
+        r'<div[^>]*class="[^"]*specification[^"]*"[^>]*>[^<]*(?:<(?!/div>)[^<]*)*</div>',
+        re.IGNORECASE,
+    ),
+    re.compile(
+        r'<div[^>]*class="[^"]*attributes[^"]*"[^>]*>[^<]*(?:<(?!/div>)[^<]*)*</div>',
+        re.IGNORECASE,
+    ),
+    re.compile(r'<ul[^>]*>[^<]*(?:<(?!/ul>)[^<]*)*</ul>', re.IGNORECASE),  # Feature lists
+]
+
+# Validation tables for extracted fields: (type, range check) per numeric
+# field, then the boolean and free-text fields
+_TYPE_VALIDATORS = {
+    "price": (float, lambda x: x > 0),
+    "size_sqm": (float, lambda x: 10 < x < 1000),  # Tightened: Min 10 m²
+    "rooms": (float, lambda x: 0.5 < x < 20),  # Allow 0.5 for studio
+    "bedrooms": (int, lambda x: 0 <= x < 20),
+    "bathrooms": (int, lambda x: 0 <= x < 10),
+    "floor": (int, lambda x: -2 <= x < 25),  # Tightened from 100
+    "year_built": (int, lambda x: 1700 <= x <= 2030),  # Expanded from 1800
+    "hwb_value": (float, lambda x: 5 < x < 1000),  # Tightened and expanded range
+    "betriebskosten_monthly": (float, lambda x: 30 <= x < 2000),  # INCREASED from €10 to €30
+    "reparaturrucklage": (float, lambda x: 10 <= x < 500),  # INCREASED from €1 to €10
+}
+_BOOLEAN_FIELDS = (
+    "elevator",
+    "balcony",
+    "terrace",
+    "garden",
+    "cellar",
+    "commission_free",
+)
+_STRING_FIELDS = (
+    "title",
+    "condition",
+    "building_type",
+    "energy_rating",
+    "heating_type",
+    "parking",
+    "address",
+    "description_summary",
+)
+
 
 class OllamaExtractor:
     """Extractor using Ollama for structured data extraction from HTML."""
@@ -91,7 +168,7 @@ class OllamaExtractor:
                     return False
 
                 # Check if model is available
-                data = response.json()
+                data = json_utils.loads(response.content)
                 models = [m.get("name", "") for m in data.get("models", [])]
                 model_base = self.model.split(":")[0]
 
@@ -117,7 +194,7 @@ class OllamaExtractor:
         self,
         html_content: str,
         existing_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         """
         Extract structured apartment data from HTML using LLM.
 
@@ -126,7 +203,8 @@ class OllamaExtractor:
             existing_data: Already extracted data to supplement
 
         Returns:
-            Dictionary of extracted fields
+            Dictionary of extracted fields merged over existing_data, or None
+            if Ollama is unavailable or every attempt failed
         """
         # Check availability first
         if self._available is None:
@@ -134,7 +212,7 @@ class OllamaExtractor:
 
         if not self._available:
             logger.info("Ollama not available, skipping LLM extraction")
-            return existing_data or {}
+            return None
 
         logger.info(f"Starting LLM extraction using model {self.model}")
 
@@ -166,7 +244,7 @@ class OllamaExtractor:
                     )
 
                     if response.status_code == 200:
-                        result = response.json()
+                        result = json_utils.loads(response.content)
                         text = result.get("response", "")
                         extracted = self._parse_json_response(text)
                         if extracted:
@@ -198,12 +276,12 @@ class OllamaExtractor:
                     f"Ollama error on attempt {attempt + 1}/{self.MAX_RETRIES}: {e}"
                 )
 
-        # Return existing data if all retries failed
+        # Signal failure so callers don't mistake it for an (empty) result
         logger.warning(
             f"LLM extraction failed after {self.MAX_RETRIES} attempts, "
-            f"returning existing data"
+            f"returning no data"
         )
-        return existing_data or {}
+        return None
 
     def _build_extraction_prompt(
         self,
@@ -317,7 +395,7 @@ Return only the JSON, no explanation."""
 
         # Strategy 1: Direct parse
         try:
-            result = json.loads(text)
+            result = json_utils.loads(text)
             if self.diagnostic_logging:
                 logger.debug("JSON parsed directly (strategy 1)")
             return result
@@ -325,10 +403,10 @@ Return only the JSON, no explanation."""
             pass
 
         # Strategy 2: Extract from markdown code block
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", text)
+        json_match = _CODE_BLOCK_RE.search(text)
         if json_match:
             try:
-                result = json.loads(json_match.group(1))
+                result = json_utils.loads(json_match.group(1))
                 if self.diagnostic_logging:
                     logger.debug("JSON parsed from code block (strategy 2)")
                 return result
@@ -336,10 +414,10 @@ Return only the JSON, no explanation."""
                 pass
 
         # Strategy 3: Extract JSON object from text
-        json_match = re.search(r"\{[\s\S]*\}", text)
+        json_match = _JSON_OBJECT_RE.search(text)
         if json_match:
             try:
-                result = json.loads(json_match.group(0))
+                result = json_utils.loads(json_match.group(0))
                 if self.diagnostic_logging:
                     logger.debug("JSON parsed from object extraction (strategy 3)")
                 return result
@@ -351,14 +429,14 @@ Return only the JSON, no explanation."""
                     logger.debug("Attempting JSON repair (strategy 4)...")
 
                 # Fix missing quotes around keys
-                repaired = re.sub(r'(\{|,)\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:', r'\1"\2":', extracted)
+                repaired = _UNQUOTED_KEY_RE.sub(r'\1"\2":', extracted)
                 # Remove trailing commas
-                repaired = re.sub(r',(\s*[}\]])', r'\1', repaired)
+                repaired = _TRAILING_COMMA_RE.sub(r'\1', repaired)
                 # Replace single quotes with double quotes
                 repaired = repaired.replace("'", '"')
 
                 try:
-                    result = json.loads(repaired)
+                    result = json_utils.loads(repaired)
                     if self.diagnostic_logging:
                         logger.debug("JSON repaired successfully (strategy 4)")
                     return result
@@ -370,15 +448,8 @@ Return only the JSON, no explanation."""
             logger.debug("Attempting regex key-value extraction (strategy 5)...")
 
         result = {}
-        patterns = [
-            (r'"([^"]+)"\s*:\s*"([^"]*)"', str),
-            (r'"([^"]+)"\s*:\s*(\d+\.?\d*)', float),
-            (r'"([^"]+)"\s*:\s*(true|false)', lambda x: x.lower() == 'true'),
-            (r'"([^"]+)"\s*:\s*null', lambda x: None),
-        ]
-
-        for pattern, converter in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern, converter in _KEY_VALUE_PATTERNS:
+            for match in pattern.finditer(text):
                 key = match.group(1)
                 value_str = match.group(2) if len(match.groups()) > 1 else None
                 try:
@@ -421,18 +492,15 @@ Return only the JSON, no explanation."""
             json_ld_scripts.append(match.group(0))
             return f"___JSON_LD_PLACEHOLDER_{len(json_ld_scripts)-1}___"
 
-        html = re.sub(
-            r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>.*?</script>',
-            save_json_ld, html, flags=re.DOTALL | re.IGNORECASE
-        )
+        html = _JSON_LD_BLOCK_RE.sub(save_json_ld, html)
 
         # Remove scripts/styles
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        html = _SCRIPT_BLOCK_RE.sub('', html)
+        html = _STYLE_BLOCK_RE.sub('', html)
 
         # Collapse whitespace
-        html = re.sub(r'\s+', ' ', html)
-        html = re.sub(r'>\s+<', '><', html)
+        html = _WHITESPACE_RE.sub(' ', html)
+        html = _INTER_TAG_SPACE_RE.sub('><', html)
 
         # Restore JSON-LD
         for idx, script in enumerate(json_ld_scripts):
@@ -443,18 +511,9 @@ Return only the JSON, no explanation."""
             original_len = len(html)
 
             # Extract priority sections
-            priority_patterns = [
-                r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>.*?</script>',
-                r'<table[^>]*>.*?</table>',  # Tables often have costs
-                r'<div[^>]*class="[^"]*specification[^"]*"[^>]*>.*?</div>',
-                r'<div[^>]*class="[^"]*attributes[^"]*"[^>]*>.*?</div>',
-                r'<ul[^>]*>.*?</ul>',  # Feature lists
-            ]
-
             priority_content = []
-            for pattern in priority_patterns:
-                matches = re.findall(pattern, html, flags=re.DOTALL | re.IGNORECASE)
-                priority_content.extend(matches)
+            for pattern in _PRIORITY_SECTION_PATTERNS:
+                priority_content.extend(pattern.findall(html))
 
             priority_html = '\n'.join(priority_content)
 
@@ -482,42 +541,8 @@ Return only the JSON, no explanation."""
         rejected_count = 0
         rejected_fields = []
 
-        # Type validation and cleaning
-        type_validators = {
-            "price": (float, lambda x: x > 0),
-            "size_sqm": (float, lambda x: 10 < x < 1000),  # Tightened: Min 10 m²
-            "rooms": (float, lambda x: 0.5 < x < 20),  # Allow 0.5 for studio
-            "bedrooms": (int, lambda x: 0 <= x < 20),
-            "bathrooms": (int, lambda x: 0 <= x < 10),
-            "floor": (int, lambda x: -2 <= x < 25),  # Tightened from 100
-            "year_built": (int, lambda x: 1700 <= x <= 2030),  # Expanded from 1800
-            "hwb_value": (float, lambda x: 5 < x < 1000),  # Tightened and expanded range
-            "betriebskosten_monthly": (float, lambda x: 30 <= x < 2000),  # INCREASED from €10 to €30
-            "reparaturrucklage": (float, lambda x: 10 <= x < 500),  # INCREASED from €1 to €10
-        }
-
-        boolean_fields = [
-            "elevator",
-            "balcony",
-            "terrace",
-            "garden",
-            "cellar",
-            "commission_free",
-        ]
-
-        string_fields = [
-            "title",
-            "condition",
-            "building_type",
-            "energy_rating",
-            "heating_type",
-            "parking",
-            "address",
-            "description_summary",
-        ]
-
         # Process numeric fields
-        for field, (expected_type, validator) in type_validators.items():
+        for field, (expected_type, validator) in _TYPE_VALIDATORS.items():
             if field in extracted and extracted[field] is not None:
                 try:
                     value = expected_type(extracted[field])
@@ -541,7 +566,7 @@ Return only the JSON, no explanation."""
                     logger.debug(f"Rejected {field}={extracted[field]} (type error: {e})")
 
         # Process boolean fields
-        for field in boolean_fields:
+        for field in _BOOLEAN_FIELDS:
             if field in extracted and extracted[field] is not None:
                 if isinstance(extracted[field], bool):
                     result[field] = extracted[field]
@@ -558,7 +583,7 @@ Return only the JSON, no explanation."""
                     logger.debug(f"Rejected {field}={extracted[field]} (invalid boolean type)")
 
         # Process string fields
-        for field in string_fields:
+        for field in _STRING_FIELDS:
             if field in extracted and extracted[field]:
                 if isinstance(extracted[field], str):
                     value = extracted[field].strip()
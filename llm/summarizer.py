@@ -10,6 +10,20 @@ from models.apartment import ApartmentListing
 
 logger = logging.getLogger(__name__)
 
+# Markdown formatting stripped from summaries
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_CODE_RE = re.compile(r'`([^`]+)`')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Lead-in phrases the model sometimes puts before the summary
+_SUMMARY_PREFIXES = (
+    "Zusammenfassung:",
+    "Summary:",
+    "Hier ist die Zusammenfassung:",
+    "Analyse:",
+)
+
 
 class ApartmentSummarizer:
     """Generates German investment summaries for apartments using Ollama LLM."""
@@ -261,23 +275,17 @@ Zusammenfassung:"""
         summary = text.strip()
 
         # Remove common prefixes/suffixes
-        prefixes_to_remove = [
-            "Zusammenfassung:",
-            "Summary:",
-            "Hier ist die Zusammenfassung:",
-            "Analyse:",
-        ]
-        for prefix in prefixes_to_remove:
+        for prefix in _SUMMARY_PREFIXES:
             if summary.startswith(prefix):
                 summary = summary[len(prefix) :].strip()
 
         # Remove markdown formatting
-        summary = re.sub(r'\*\*([^*]+)\*\*', r'\1', summary)  # Bold
-        summary = re.sub(r'\*([^*]+)\*', r'\1', summary)  # Italic
-        summary = re.sub(r'`([^`]+)`', r'\1', summary)  # Code
+        summary = _BOLD_RE.sub(r'\1', summary)  # Bold
+        summary = _ITALIC_RE.sub(r'\1', summary)  # Italic
+        summary = _CODE_RE.sub(r'\1', summary)  # Code
 
         # Remove extra whitespace
-        summary = re.sub(r'\s+', ' ', summary)
+        summary = _WHITESPACE_RE.sub(' ', summary)
         summary = summary.strip()
 
         # Check word count (keep short summaries, just log warning)
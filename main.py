@@ -1,39 +1,300 @@
 """Enhanced apartment scraper with investment analysis."""
 
 import asyncio
+import hashlib
 import json
 import logging
 import re
+import shelve
 import signal
+import time
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
-from crawl4ai import AsyncWebCrawler
+import httpx
+import yaml
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
 
 from llm.analyzer import InvestmentAnalyzer
-from llm.extractor import OllamaExtractor
-from llm.summarizer import ApartmentSummarizer
 from models.apartment import ApartmentListing
-from models.constants import AREA_ID_TO_LOCATION, PLZ_TO_AREA_ID
+from models.constants import AREA_ID_TO_LOCATION, PLZ_TO_AREA_ID, VIENNA_DISTRICTS
 from models.metadata import ApartmentMetadata
 from utils.address_parser import AustrianAddressParser
+from utils import json_utils
 from utils.extractors import AustrianRealEstateExtractor
 from utils.markdown_generator import MarkdownGenerator
-from utils.pdf_generator import PDFGenerator
+from utils.rate_limiter import TokenBucketLimiter
 from utils.top_n_tracker import TopNTracker
-from utils.translations import HEADERS, LABELS, PHRASES, RECOMMENDATIONS, TABLE_HEADERS
+from utils.translations import PHRASES, RECOMMENDATIONS
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # Suppress font subsetting logs from PDF generation
 logging.getLogger('fontTools.subset').setLevel(logging.WARNING)
 
+# config.json next to this script, resolved once at import
+_CONFIG_PATH = Path(__file__).resolve().parent / "config.json"
+
+# Browser-like User-Agent for plain HTTP search page fetches
+_HTTP_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# Site root that relative listing paths from JSON-LD are resolved against
+_WILLHABEN_BASE_URL = "https://www.willhaben.at"
+
+# SVG path of the favourite star icon, only rendered on real (non-ad) listings
+_STAR_ICON_PATH = "m12 4 2.09 4.25a1.52 1.52 0 0 0 1.14.82l4.64.64-3.42 3.32"
+
+# JSON-LD blocks on search and detail pages, located with plain str.find
+_JSON_LD_OPEN_TAG = '<script type="application/ld+json">'
+_SCRIPT_CLOSE_TAG = "</script>"
+# First "@type" of a block, matched against its head only
+_JSON_LD_TYPE_RE = re.compile(r'"@type"\s*:\s*"([^"]+)"')
+
+# JSON-LD streetAddress split into street and house number
+_STREET_HOUSE_NUMBER_RE = re.compile(r"^(.+?)\s+(\d+[a-zA-Z]?)$")
+
+# Characters dropped from city/district names in apartment filenames
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\s-]")
+
+# Address extraction from page HTML
+_JSON_LD_STREET_ADDRESS_RE = re.compile(r'"address"[:\s]*\{[^}]*"streetAddress"[:\s]*"([^"]+)"')
+_ADDRESS_HINT_RE = re.compile(r"\d{4}|straße|gasse|weg|platz", re.IGNORECASE)
+_ADDRESS_PATTERNS = [
+    # Full address with street, postal code and city. The lookbehind anchors
+    # the street name to the start of a word: the leftmost match starts there
+    # anyway, and it stops the engine from rescanning every word suffix
+    re.compile(
+        r"(?<![A-Za-zäöüÄÖÜß\-])"
+        r"([A-Za-zäöüÄÖÜß\-]+(?:straße|gasse|weg|platz|ring|allee)\s+\d+[^,<]*,\s*\d{4}\s+[A-Za-zäöüÄÖÜß\s]+)",
+        re.IGNORECASE,
+    ),
+    # Address label patterns
+    re.compile(r"(?:Adresse|Standort|Lage)[:\s]*</[^>]+>\s*<[^>]+>([^<]+)", re.IGNORECASE),
+    re.compile(r"(?:Adresse|Standort|Lage)[:\s]*([^<\n]{10,80})", re.IGNORECASE),
+]
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Title extraction patterns
+_H1_RE = re.compile(r"<h1[^>]*>([^<]+)</h1>", re.IGNORECASE)
+_OG_TITLE_RE = re.compile(r'<meta property="og:title" content="([^"]+)"', re.IGNORECASE)
+
+# Address fallbacks derived from the listing URL, in priority order.
+# Pattern: /wien-1030-landstrasse/ or /kaernten/klagenfurt/
+# (Vienna with postal code, /wien-1030-landstrasse/, is matched by slicing
+# in _vienna_postal_code_from_url before these run). Each entry starts with
+# lowercase substrings one of which every match contains; the regex only
+# runs when the lowered URL has one of them.
+_URL_ADDRESS_PATTERNS = [
+    # Other cities with postal code: /1030-landstrasse/
+    (
+        ("-",),
+        re.compile(r"/(\d{4})-([^/]+)", re.IGNORECASE),
+        lambda m: f"{m.group(1)}",
+    ),
+    # State/City format: /kaernten/villach/ or /wien/leopoldstadt/
+    (
+        ("/kaernten/", "/kärnten/"),
+        re.compile(r"/(?:kaernten|kärnten)/([a-z\-]+)/", re.IGNORECASE),
+        lambda m: f"{m.group(1).replace('-', ' ').title()}, Kärnten",
+    ),
+    (
+        ("/steiermark/",),
+        re.compile(r"/(?:steiermark)/([a-z\-]+)/", re.IGNORECASE),
+        lambda m: f"{m.group(1).replace('-', ' ').title()}, Steiermark",
+    ),
+    (
+        ("/tirol/",),
+        re.compile(r"/(?:tirol)/([a-z\-]+)/", re.IGNORECASE),
+        lambda m: f"{m.group(1).replace('-', ' ').title()}, Tirol",
+    ),
+    (
+        ("/wien/",),
+        re.compile(r"/wien/([a-z\-]+)/", re.IGNORECASE),
+        lambda m: "Wien",
+    ),
+]
+
+# Fields filled from regex extraction when still unset (primary fields use a falsy check)
+_REGEX_PRIMARY_FIELDS = ("price", "size_sqm", "rooms")
+_REGEX_FIELDS = (
+    "betriebskosten_monthly",  # Skipped if already applied by the overwrite step
+    "reparaturrucklage",
+    "floor",
+    "floor_text",
+    "year_built",
+    "condition",
+    "building_type",
+    "energy_rating",
+    "hwb_value",
+    "fgee_value",
+    "heating_type",
+    "elevator",
+    "balcony",
+    "terrace",
+    "garden",
+    "parking",
+    "cellar",
+    "storage",
+    "commission_free",
+    "commission_percent",
+)
+
+# Fields taken from LLM extraction (LLM keys match ApartmentListing attributes)
+_LLM_FIELDS = (
+    "title",
+    "price",
+    "size_sqm",
+    "rooms",
+    "bedrooms",
+    "bathrooms",
+    "floor",
+    "year_built",
+    "condition",
+    "building_type",
+    "energy_rating",
+    "heating_type",
+    "betriebskosten_monthly",
+    "reparaturrucklage",
+    "hwb_value",
+)
+_LLM_BOOLEAN_FIELDS = (
+    "elevator",
+    "balcony",
+    "terrace",
+    "garden",
+    "parking",
+    "cellar",
+    "commission_free",
+)
+# Current values sent to the LLM for verification (everything it may set)
+_LLM_CONTEXT_FIELDS = _LLM_FIELDS + _LLM_BOOLEAN_FIELDS
+
+# Important fields checked before triggering LLM extraction, categorized by
+# user priority: Financial > Features > Address. Each getter reads all fields
+# of its category in one call.
+_MISSING_FIELD_GETTERS = (
+    (
+        "financial",
+        attrgetter(
+            "betriebskosten_monthly",
+            "reparaturrucklage",
+            "heating_cost_monthly",
+            "price_per_sqm",
+        ),
+    ),
+    (
+        "features",
+        attrgetter(
+            "bedrooms",
+            "bathrooms",
+            "elevator",
+            "balcony",
+            "terrace",
+            "garden",
+            "parking",
+            "cellar",
+            "commission_free",
+        ),
+    ),
+    (
+        "address",
+        attrgetter("postal_code", "city", "street", "house_number", "district"),
+    ),
+    (
+        "other",
+        attrgetter("rooms", "year_built", "condition", "energy_rating", "hwb_value"),
+    ),
+)
+
+# Summary table row templates (parsed once, filled via str.format_map per row)
+_FAILED_ROW_TEMPLATE = (
+    "| {idx} | {reason} | {price} | {size} | {bk} | {location} | {details} |"
+)
+_SUMMARY_ROW_TEMPLATE = (
+    "| {rank} | {status} | {score} | {recommendation} | {price} | "
+    "{size} | {yield_} | {location} | {details} |"
+)
+
+
+@lru_cache(maxsize=4096)
+def _listing_id_from_url(url: str) -> str:
+    """Extract listing ID from URL (memoized, called several times per listing)."""
+    # willhaben URLs typically end with the listing ID: ".../<digits>" or ".../<digits>/"
+    path = url[:-1] if url.endswith("/") else url
+    slash = path.rfind("/")
+    if slash != -1:
+        tail = path[slash + 1:]
+        if tail.isdecimal():
+            return tail
+    # Fallback to a digest of the URL: stable across runs (unlike hash(),
+    # which is salted per process) and still an integer for _claim_listing
+    digest = hashlib.blake2b(url.encode(), digest_size=8).digest()
+    return str(int.from_bytes(digest, "big"))
+
+
+def _vienna_postal_code_from_url(url: str) -> Optional[str]:
+    """
+    Find the postal code in a Vienna listing URL segment like /wien-1030-landstrasse/.
+
+    Args:
+        url: Listing URL
+
+    Returns:
+        Four-digit postal code, or None if the URL has no such segment
+    """
+    url = url.lower()
+    idx = url.find("/wien-")
+    while idx != -1:
+        code = url[idx + 6:idx + 10]
+        # "/wien-" + 4 digits + "-" + at least one character of the district name
+        if (
+            len(code) == 4
+            and code.isdecimal()
+            and url[idx + 10:idx + 11] == "-"
+            and url[idx + 11:idx + 12] not in ("", "/")
+        ):
+            return code
+        idx = url.find("/wien-", idx + 1)
+    return None
+
+
+def _absolute_listing_url(url: str) -> Optional[str]:
+    """
+    Resolve a listing URL from search-page JSON-LD against the site root.
+
+    Args:
+        url: Site-relative path ("/iad/...") or absolute URL
+
+    Returns:
+        Absolute URL, or None for anything that is neither
+    """
+    if url.startswith(("https://", "http://")):
+        return url
+    if url.startswith("/"):
+        return _WILLHABEN_BASE_URL + url
+    return None
+
+
+class SummaryRow(NamedTuple):
+    """Preformatted display strings for one apartment in summary.md."""
+
+    rank: int
+    status: str
+    score: str
+    recommendation: str
+    price: str
+    size: str
+    yield_: str
+    location: str
+    details: str
+
 
 class EnhancedApartmentScraper:
     """Enhanced apartment scraper with investment analysis capabilities."""
@@ -61,6 +322,9 @@ class EnhancedApartmentScraper:
         self.use_llm = llm_config.get("enabled", False)
 
         if self.use_llm:
+            # Imported lazily: runs without LLM never load the Ollama client
+            from llm.extractor import OllamaExtractor
+
             llm_model = llm_config.get("model", "qwen3:8b")
             diagnostic_logging = llm_config.get("diagnostics_enabled", False)
             html_max_chars = llm_config.get("html_max_chars", 50000)
@@ -79,6 +343,8 @@ class EnhancedApartmentScraper:
         # LLM summarizer (optional)
         self.generate_llm_summary = llm_config.get("generate_summary", False)
         if self.generate_llm_summary:
+            from llm.summarizer import ApartmentSummarizer
+
             llm_model = llm_config.get("model", "qwen3:8b")
             summary_max_words = llm_config.get("summary_max_words", 150)
             summary_timeout = llm_config.get("summary_timeout", 120)  # NEW: Get timeout from config
@@ -92,6 +358,17 @@ class EnhancedApartmentScraper:
         else:
             self.summarizer = None
 
+        # Per-listing LLM settings, read once instead of on every apartment
+        self.llm_trigger_mode = llm_config.get("trigger_mode", "conservative")
+        self.llm_quality_check = llm_config.get("quality_check_enabled", True)
+        self.extraction_timeout = llm_config.get("extraction_timeout", 180)
+        self.summary_timeout = llm_config.get("summary_timeout", 120)
+        self.diagnostics_enabled = llm_config.get("diagnostics_enabled", False)
+
+        # Concurrent Ollama requests (extraction + summaries), separate from fetch concurrency
+        self.llm_concurrency = llm_config.get("llm_concurrency", 2)
+        self._llm_semaphore = asyncio.Semaphore(self.llm_concurrency)
+
         # Markdown generator with timestamped folder
         output_folder = config.get("output_folder", "output")
         self.run_folder = Path(output_folder) / f"apartments_{self.run_id}"
@@ -111,18 +388,69 @@ class EnhancedApartmentScraper:
         rate_config = config.get("rate_limiting", {})
         self.delay_apartment = rate_config.get("delay_apartment", 0.5)
         self.delay_page = rate_config.get("delay_page", 1.0)
+        self.rate_burst = rate_config.get("burst", 1)
+        self.max_retries = rate_config.get("max_retries", 3)
+        self.backoff_base = rate_config.get("backoff_base", 1.0)
+        self._rate_limiters: Dict[str, TokenBucketLimiter] = {}
+
+        # Crawl settings, built once and shared by every request of a run
+        self._search_run_config = CrawlerRunConfig(
+            wait_for="css:section",
+            delay_before_return_html=3.0,
+            js_code="window.scrollTo(0, document.body.scrollHeight);",
+        )
+        self._detail_run_config = CrawlerRunConfig(
+            wait_for="css:main",
+            delay_before_return_html=2.0,
+        )
+
+        # Optional plain-HTTP fetch of search pages (their JSON-LD ItemList is
+        # server-rendered); falls back to the browser when it yields nothing
+        self.fast_search_pages = config.get("fast_search_pages", False)
+        # Same for detail pages; pages without the star icon (ads, or markup
+        # the server did not render) are re-fetched with the browser
+        self.fast_detail_pages = config.get("fast_detail_pages", False)
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+        # Concurrent apartment processing per page (fetch + extraction + LLM)
+        self.max_concurrent_apartments = rate_config.get("max_concurrent_apartments", 8)
+        self._apartment_semaphore = asyncio.BoundedSemaphore(self.max_concurrent_apartments)
+
+        # Optional cap on processed apartments per run (None = unlimited)
+        self.max_apartments = config.get("max_apartments")
+        # Listings currently being processed; each holds one slot under the cap
+        self._apartments_in_progress = 0
 
         # Tracking - NEW: lightweight metadata instead of full objects
-        self.seen_listings: Set[str] = set()
+        self.seen_urls: Set[str] = set()
+        # Listing IDs are numeric (or a numeric hash fallback), stored as int
+        self.seen_listings: Set[int] = set()
         self.apartment_metadata: List[ApartmentMetadata] = []
+
+        # Optionally skip listings already written by earlier runs
+        self.skip_seen_listings = config.get("skip_seen_listings", False)
+        self._seen_listings_path = Path(output_folder) / ".seen_listings"
+        self._previously_seen: Set[int] = set()
+        if self.skip_seen_listings and self._seen_listings_path.exists():
+            self._previously_seen = set(map(int, self._seen_listings_path.read_text().split()))
+            self.seen_listings.update(self._previously_seen)
+            logger.info(f"Skipping {len(self._previously_seen)} listings seen in earlier runs")
         self.top_n_tracker = TopNTracker(self.pdf_top_n)
 
         # Create apartments subfolder immediately
         self.apartments_folder = self.run_folder / "apartments"
         self.apartments_folder.mkdir(parents=True, exist_ok=True)
 
+        # Optional LLM extraction cache shared across runs (keyed by model, listing
+        # ID and listing content), so unchanged listings skip the slow Ollama call
+        self._llm_cache: Optional[shelve.Shelf] = None
+        if self.use_llm and llm_config.get("cache_results", False):
+            self._llm_cache = shelve.open(str(Path(output_folder) / ".llm_cache"))
+
         # Translate postal codes to area_ids for willhaben
         self.area_ids = self._translate_postal_codes_to_area_ids()
+        # Search URL up to the page number; identical for every page of a run
+        self._search_url_prefix = self._build_search_url_prefix()
 
         # Graceful interrupt handling
         self.interrupted = False
@@ -176,9 +504,9 @@ class EnhancedApartmentScraper:
 
         return area_ids
 
-    def build_willhaben_url(self, page: int = 1) -> str:
-        """Build willhaben.at search URL from configuration parameters."""
-        base_url = "https://www.willhaben.at/iad/immobilien/eigentumswohnung/eigentumswohnung-angebote"
+    def _build_search_url_prefix(self) -> str:
+        """Build the page-independent part of the willhaben.at search URL."""
+        base_url = f"{_WILLHABEN_BASE_URL}/iad/immobilien/eigentumswohnung/eigentumswohnung-angebote"
 
         params = []
 
@@ -191,27 +519,24 @@ class EnhancedApartmentScraper:
         if max_price:
             params.append(f"PRICE_TO={int(max_price)}")
 
-        # Add pagination
-        params.append(f"page={page}")
-        params.append("isNavigation=true")
+        # Pagination parameters are appended per page by build_willhaben_url
+        query = "&".join(params)
+        return f"{base_url}?{query}&" if query else f"{base_url}?"
 
-        return f"{base_url}?{'&'.join(params)}"
+    def build_willhaben_url(self, page: int = 1) -> str:
+        """Build willhaben.at search URL from configuration parameters."""
+        return f"{self._search_url_prefix}page={page}&isNavigation=true"
 
     def extract_listing_urls(self, html: str) -> List[Dict[str, str]]:
         """Extract apartment URLs from JSON-LD structured data."""
         try:
-            match = re.search(
-                r'<script type="application/ld\+json">({.*?"@type":"ItemList".*?})</script>',
-                html,
-                re.DOTALL,
-            )
-            if match:
-                json_data = json.loads(match.group(1))
+            json_data = self._parse_json_ld_blocks(html, {"ItemList"}).get("ItemList")
+            if json_data:
                 items = json_data.get("itemListElement", [])
                 return [
-                    {"url": f"https://www.willhaben.at{item.get('url', '')}"}
+                    {"url": url}
                     for item in items
-                    if item.get("url")
+                    if item.get("url") and (url := _absolute_listing_url(item["url"]))
                 ]
         except Exception as e:
             logger.warning(f"Error extracting JSON-LD: {e}")
@@ -219,12 +544,7 @@ class EnhancedApartmentScraper:
 
     def extract_listing_id(self, url: str) -> str:
         """Extract listing ID from URL."""
-        # willhaben URLs typically end with the listing ID
-        match = re.search(r"/(\d+)/?$", url)
-        if match:
-            return match.group(1)
-        # Fallback to hash of URL
-        return str(hash(url))
+        return _listing_id_from_url(url)
 
     async def extract_apartment_data(
         self, html: str, url: str
@@ -236,57 +556,25 @@ class EnhancedApartmentScraper:
         2. Regex patterns (fallback)
         3. LLM extraction (if enabled, for missing fields)
         """
-        listing_id = self.extract_listing_id(url)
-
-        # Check for ad filtering - star icon indicates real listing
-        star_icon_path = "m12 4 2.09 4.25a1.52 1.52 0 0 0 1.14.82l4.64.64-3.42 3.32"
-        if star_icon_path not in html:
+        # Check for ad filtering first - star icon indicates real listing,
+        # so ads are rejected before any parsing work
+        if html.find(_STAR_ICON_PATH) == -1:
             logger.debug(f"Skipping ad/promoted listing: {url}")
             return None
 
-        # Initialize apartment with basic data
-        apartment = ApartmentListing(
-            listing_id=listing_id,
-            source_url=url,
-            source_portal=self.portal,
+        # Parsing is synchronous regex/DOM work; run it in a worker thread so
+        # other listings keep progressing on the event loop meanwhile
+        apartment, json_ld_data, regex_data = await asyncio.to_thread(
+            self._extract_static_data, html, url
         )
-
-        # Strategy 1: Extract from JSON-LD
-        json_ld_data = self._extract_json_ld(html)
-        if json_ld_data:
-            apartment.raw_json_ld = json_ld_data
-            self._apply_json_ld_data(apartment, json_ld_data)
-
-        # Strategy 1.5: DOM-based extraction (more reliable for separated labels/values)
-        dom_data = self.extractor.extract_from_html_dom(html)
-        if dom_data:
-            self._apply_regex_data(apartment, dom_data)  # Reuse same apply logic
-            logger.debug(f"DOM extraction found {len(dom_data)} fields")
-
-        # Strategy 2: Extract using regex patterns (more authoritative for betriebskosten)
-        regex_data = self.extractor.extract_from_html(html)
-
-        # Diagnostic logging for critical fields
-        if "size_sqm" in regex_data:
-            logger.info(
-                f"Regex extracted size_sqm: {regex_data['size_sqm']} m² "
-                f"for {url}"
-            )
-
-        self._apply_regex_data(apartment, regex_data, allow_betriebskosten_overwrite=True)
-
-        # Extract address
-        address_text = self._extract_address_from_html(html, url)
-        if address_text:
-            parsed_address = self.address_parser.parse_address(address_text)
-            self._apply_address_data(apartment, parsed_address)
+        listing_id = apartment.listing_id
 
         # Strategy 3: LLM extraction (if enabled and quality-based triggers)
         llm_data = None  # Initialize to prevent UnboundLocalError in diagnostics
         if self.use_llm and self.llm_extractor:
             # Get trigger configuration
-            trigger_mode = self.config.get("llm_settings", {}).get("trigger_mode", "conservative")
-            quality_check = self.config.get("llm_settings", {}).get("quality_check_enabled", True)
+            trigger_mode = self.llm_trigger_mode
+            quality_check = self.llm_quality_check
 
             should_run_llm = False
             trigger_reason = []
@@ -305,7 +593,7 @@ class EnhancedApartmentScraper:
                     trigger_reason.extend(quality_issues)
 
             # Check 3: Missing important fields
-            if trigger_mode in ["aggressive", "always"]:
+            if trigger_mode in ("aggressive", "always"):
                 if self._has_missing_fields(apartment):
                     should_run_llm = True
                     if "missing_optional_fields" not in trigger_reason:
@@ -319,7 +607,6 @@ class EnhancedApartmentScraper:
 
             if should_run_llm:
                 # Count non-None fields before LLM extraction
-                import time
                 fields_before = sum(1 for k, v in apartment.to_dict().items() if v not in (None, ""))
                 start_time = time.time()
 
@@ -327,32 +614,59 @@ class EnhancedApartmentScraper:
                     f"LLM extraction triggered for {listing_id}: {', '.join(trigger_reason)} "
                     f"(fields before: {fields_before})"
                 )
-                existing_data = apartment.to_dict()
+                # Only the fields the LLM can fill/correct go into the prompt;
+                # the full to_dict() would also send raw_json_ld and metadata
+                existing_data = {
+                    field: value
+                    for field in _LLM_CONTEXT_FIELDS
+                    if (value := getattr(apartment, field)) is not None
+                }
+                cache_key = (
+                    self._llm_cache_key(listing_id, json_ld_data, existing_data, html)
+                    if self._llm_cache is not None
+                    else None
+                )
                 try:
                     # Add hard timeout wrapper to prevent indefinite hangs
-                    extraction_timeout = self.config.get("llm_settings", {}).get("extraction_timeout", 180)
-                    llm_data = await asyncio.wait_for(
-                        self.llm_extractor.extract_structured_data(html, existing_data),
-                        timeout=extraction_timeout,
-                    )
-                    logger.info(f"LLM extraction completed for listing {listing_id}")
-                    self._apply_llm_data(apartment, llm_data)
-
-                    # Count non-None fields after LLM extraction
-                    fields_after = sum(1 for k, v in apartment.to_dict().items() if v not in (None, ""))
-                    elapsed_time = time.time() - start_time
-                    fields_added = fields_after - fields_before
-
-                    if fields_added > 0:
-                        logger.info(
-                            f"LLM extraction added {fields_added} fields "
-                            f"(before: {fields_before} → after: {fields_after}) "
-                            f"in {elapsed_time:.1f}s"
-                        )
+                    extraction_timeout = self.extraction_timeout
+                    if cache_key and cache_key in self._llm_cache:
+                        llm_data = self._llm_cache[cache_key]
+                        logger.info(f"LLM extraction for listing {listing_id} loaded from cache")
                     else:
+                        async with self._llm_semaphore:
+                            llm_data = await asyncio.wait_for(
+                                self.llm_extractor.extract_structured_data(html, existing_data),
+                                timeout=extraction_timeout,
+                            )
+                        # None means Ollama was unavailable or every attempt
+                        # failed; only real results are cached
+                        if cache_key and llm_data is not None:
+                            self._llm_cache[cache_key] = llm_data
+
+                    if llm_data is None:
                         logger.warning(
-                            f"LLM extraction completed but added 0 new fields in {elapsed_time:.1f}s"
+                            f"LLM extraction returned no data for listing {listing_id}, "
+                            f"continuing without LLM data"
                         )
+                    else:
+                        logger.info(f"LLM extraction completed for listing {listing_id}")
+                        self._apply_llm_data(apartment, llm_data)
+
+                        # Count non-None fields after LLM extraction
+                        fields_after = sum(1 for k, v in apartment.to_dict().items() if v not in (None, ""))
+                        elapsed_time = time.time() - start_time
+                        fields_added = fields_after - fields_before
+
+                        if fields_added > 0:
+                            logger.info(
+                                f"LLM extraction added {fields_added} fields "
+                                f"(before: {fields_before} → after: {fields_after}) "
+                                f"in {elapsed_time:.1f}s"
+                            )
+                        else:
+                            logger.warning(
+                                f"LLM extraction completed but added 0 new fields in {elapsed_time:.1f}s"
+                            )
 
                 except asyncio.TimeoutError:
                     logger.error(
@@ -376,9 +690,11 @@ class EnhancedApartmentScraper:
         # Note: Validation now happens in process_apartment() to allow saving invalid apartments
         # with validation_failed flag for manual review
 
-        # Diagnostic mode: save extraction data for debugging
-        if self.config.get("llm_settings", {}).get("diagnostics_enabled", False):
-            self._save_diagnostic_data(
+        # Diagnostic mode: save extraction data for debugging (encoding and
+        # file I/O in a worker thread, off the event loop)
+        if self.diagnostics_enabled:
+            await asyncio.to_thread(
+                self._save_diagnostic_data,
                 listing_id=listing_id,
                 url=url,
                 html=html,
@@ -390,20 +706,124 @@ class EnhancedApartmentScraper:
 
         return apartment
 
+    def _extract_static_data(
+        self, html: str, url: str
+    ) -> Tuple[ApartmentListing, Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Run the non-LLM extraction strategies (JSON-LD, DOM, regex, address).
+
+        Args:
+            html: Listing page HTML
+            url: Listing URL
+
+        Returns:
+            Tuple of (apartment, raw JSON-LD Product data, regex extraction data)
+        """
+        listing_id = self.extract_listing_id(url)
+
+        # Initialize apartment with basic data
+        apartment = ApartmentListing(
+            listing_id=listing_id,
+            source_url=url,
+            source_portal=self.portal,
+        )
+
+        # Strategy 1: Extract from JSON-LD
+        json_ld_data = self._extract_json_ld(html)
+        if json_ld_data:
+            apartment.raw_json_ld = json_ld_data
+            self._apply_json_ld_data(apartment, json_ld_data)
+
+        # Strategy 1.5: DOM-based extraction (more reliable for separated labels/values)
+        dom_data = self.extractor.extract_from_html_dom(html)
+        if dom_data:
+            self._apply_regex_data(apartment, dom_data)  # Reuse same apply logic
+            logger.debug(f"DOM extraction found {len(dom_data)} fields")
+
+        # Strategy 2: Extract using regex patterns (more authoritative for betriebskosten)
+        # Primary fields only fill gaps, so skip the scans for ones already known;
+        # diagnostics mode runs them all to compare regex against JSON-LD values
+        known_fields = (
+            []
+            if self.diagnostics_enabled
+            else [field for field in _REGEX_PRIMARY_FIELDS if getattr(apartment, field)]
+        )
+        regex_data = self.extractor.extract_from_html(html, skip_fields=known_fields)
+
+        # Diagnostic logging for critical fields
+        if "size_sqm" in regex_data:
+            logger.info(
+                f"Regex extracted size_sqm: {regex_data['size_sqm']} m² "
+                f"for {url}"
+            )
+
+        self._apply_regex_data(apartment, regex_data, allow_betriebskosten_overwrite=True)
+
+        # Extract address
+        address_text = self._extract_address_from_html(html, url)
+        if address_text:
+            parsed_address = self.address_parser.parse_address(address_text)
+            self._apply_address_data(apartment, parsed_address)
+
+        return apartment, json_ld_data, regex_data
+
+    def _parse_json_ld_blocks(
+        self, html: str, types: Optional[Set[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse the JSON-LD script blocks of a page in a single scan.
+
+        Args:
+            html: Page HTML
+            types: Only decode blocks of these @types (None = all). The
+                top-level type is peeked from the start of each block, so
+                unwanted blocks are skipped without running the JSON decoder
+                over them; blocks whose type can't be peeked are decoded.
+
+        Returns:
+            Dict mapping schema.org @type (e.g. "Product", "ItemList") to the
+            first block of that type
+        """
+        blocks: Dict[str, Dict[str, Any]] = {}
+        tag_pos = html.find(_JSON_LD_OPEN_TAG)
+        while tag_pos != -1:
+            start = tag_pos + len(_JSON_LD_OPEN_TAG)
+            end = html.find(_SCRIPT_CLOSE_TAG, start)
+            if end == -1:
+                break
+            tag_pos = html.find(_JSON_LD_OPEN_TAG, end)
+
+            if types is not None:
+                type_match = _JSON_LD_TYPE_RE.search(html, start, min(end, start + 200))
+                # Only trust an "@type" at brace depth 1 (a single "{" and no
+                # "}" before it); a nested one such as offers' "Offer" can come
+                # first, so anything else is decoded to be sure
+                if (
+                    type_match
+                    and type_match.group(1) not in types
+                    and html.count("{", start, type_match.start()) == 1
+                    and html.find("}", start, type_match.start()) == -1
+                ):
+                    continue
+
+            # Only JSON objects are kept, so anything else (an array, or
+            # script text mislabelled as JSON-LD) is skipped undecoded
+            body = html[start:end].lstrip()
+            if not body.startswith("{"):
+                continue
+
+            try:
+                data = json_utils.loads(body)
+            except json.JSONDecodeError as e:
+                logger.debug(f"Error parsing JSON-LD: {e}")
+                continue
+            if isinstance(data, dict) and isinstance(data.get("@type"), str):
+                blocks.setdefault(data["@type"], data)
+        return blocks
+
     def _extract_json_ld(self, html: str) -> Optional[Dict[str, Any]]:
         """Extract JSON-LD product data from HTML."""
-        try:
-            # Look for product JSON-LD
-            match = re.search(
-                r'<script type="application/ld\+json">({.*?"@type":\s*"Product".*?})</script>',
-                html,
-                re.DOTALL,
-            )
-            if match:
-                return json.loads(match.group(1))
-        except Exception as e:
-            logger.debug(f"Error parsing JSON-LD: {e}")
-        return None
+        return self._parse_json_ld_blocks(html, {"Product"}).get("Product")
 
     def _apply_json_ld_data(
         self, apartment: ApartmentListing, data: Dict[str, Any]
@@ -428,18 +848,18 @@ class EnhancedApartmentScraper:
                 address = available_at.get("address", {})
                 if isinstance(address, dict):
                     # Extract structured address fields
-                    if address.get("postalCode") and not apartment.postal_code:
-                        apartment.postal_code = str(address["postalCode"])
+                    if (postal_code := address.get("postalCode")) and not apartment.postal_code:
+                        apartment.postal_code = str(postal_code)
                         logger.debug(f"Extracted postal_code from JSON-LD: {apartment.postal_code}")
 
-                    if address.get("addressLocality") and not apartment.city:
-                        apartment.city = str(address["addressLocality"])
+                    if (locality := address.get("addressLocality")) and not apartment.city:
+                        apartment.city = str(locality)
                         logger.debug(f"Extracted city from JSON-LD: {apartment.city}")
 
-                    if address.get("streetAddress") and not apartment.street:
-                        street_text = str(address["streetAddress"])
+                    if (street_address := address.get("streetAddress")) and not apartment.street:
+                        street_text = str(street_address)
                         # Parse street and house number
-                        street_match = re.match(r"^(.+?)\s+(\d+[a-zA-Z]?)$", street_text)
+                        street_match = _STREET_HOUSE_NUMBER_RE.match(street_text)
                         if street_match:
                             apartment.street = street_match.group(1).strip()
                             apartment.house_number = street_match.group(2)
@@ -448,15 +868,14 @@ class EnhancedApartmentScraper:
                             apartment.street = street_text
                             logger.debug(f"Extracted street from JSON-LD: {apartment.street}")
 
-                    if address.get("addressRegion") and not apartment.state:
-                        apartment.state = str(address["addressRegion"])
+                    if (region := address.get("addressRegion")) and not apartment.state:
+                        apartment.state = str(region)
 
                     # Vienna district extraction from postal code
                     if apartment.postal_code and apartment.postal_code.startswith("1"):
                         district_num = self.address_parser.extract_district_from_text(apartment.postal_code)
                         if district_num and not apartment.district_number:
                             apartment.district_number = district_num
-                            from models.constants import VIENNA_DISTRICTS
                             apartment.district = VIENNA_DISTRICTS.get(district_num, {}).get("name")
                             logger.debug(f"Extracted Vienna district from JSON-LD postal code: {district_num}")
 
@@ -465,12 +884,9 @@ class EnhancedApartmentScraper:
     ) -> None:
         """Apply regex-extracted data to apartment."""
         # Only apply if not already set
-        if not apartment.price and "price" in data:
-            apartment.price = data["price"]
-        if not apartment.size_sqm and "size_sqm" in data:
-            apartment.size_sqm = data["size_sqm"]
-        if not apartment.rooms and "rooms" in data:
-            apartment.rooms = data["rooms"]
+        for field in _REGEX_PRIMARY_FIELDS:
+            if not getattr(apartment, field) and field in data:
+                setattr(apartment, field, data[field])
 
         # Special handling for betriebskosten: allow regex to overwrite DOM extraction
         if allow_betriebskosten_overwrite and "betriebskosten_monthly" in data:
@@ -486,30 +902,7 @@ class EnhancedApartmentScraper:
                 apartment.betriebskosten_monthly = new_value
 
         # Apply other fields
-        field_mappings = [
-            "betriebskosten_monthly",  # Will be skipped if already applied above
-            "reparaturrucklage",
-            "floor",
-            "floor_text",
-            "year_built",
-            "condition",
-            "building_type",
-            "energy_rating",
-            "hwb_value",
-            "fgee_value",
-            "heating_type",
-            "elevator",
-            "balcony",
-            "terrace",
-            "garden",
-            "parking",
-            "cellar",
-            "storage",
-            "commission_free",
-            "commission_percent",
-        ]
-
-        for field in field_mappings:
+        for field in _REGEX_FIELDS:
             if field in data and getattr(apartment, field) is None:
                 setattr(apartment, field, data[field])
 
@@ -703,66 +1096,37 @@ class EnhancedApartmentScraper:
             return (False, "exists")
 
         # Apply each field with smart overwrite logic
-        field_mappings = {
-            "title": "title",
-            "price": "price",
-            "size_sqm": "size_sqm",
-            "rooms": "rooms",
-            "bedrooms": "bedrooms",
-            "bathrooms": "bathrooms",
-            "floor": "floor",
-            "year_built": "year_built",
-            "condition": "condition",
-            "building_type": "building_type",
-            "energy_rating": "energy_rating",
-            "heating_type": "heating_type",
-            "betriebskosten_monthly": "betriebskosten_monthly",
-            "reparaturrucklage": "reparaturrucklage",
-            "hwb_value": "hwb_value",
-        }
-
-        for llm_key, apt_field in field_mappings.items():
-            if llm_key not in data or data[llm_key] is None:
+        for field in _LLM_FIELDS:
+            llm_value = data.get(field)
+            if llm_value is None:
                 continue
 
-            llm_value = data[llm_key]
-            current_value = getattr(apartment, apt_field)
+            current_value = getattr(apartment, field)
 
-            should_replace, reason = should_overwrite(apt_field, current_value, llm_value)
+            should_replace, reason = should_overwrite(field, current_value, llm_value)
 
             if should_replace:
-                setattr(apartment, apt_field, llm_value)
+                setattr(apartment, field, llm_value)
                 if current_value is not None and current_value != "":
-                    fields_replaced.append(f"{apt_field}={current_value}→{llm_value} ({reason})")
+                    fields_replaced.append(f"{field}={current_value}→{llm_value} ({reason})")
                 else:
-                    fields_added.append(f"{apt_field}={llm_value}")
+                    fields_added.append(f"{field}={llm_value}")
             else:
-                fields_kept.append(f"{apt_field}={current_value} ({reason})")
+                fields_kept.append(f"{field}={current_value} ({reason})")
 
         # Boolean features (always fill if missing)
-        boolean_fields = {
-            "elevator": "elevator",
-            "balcony": "balcony",
-            "terrace": "terrace",
-            "garden": "garden",
-            "parking": "parking",
-            "cellar": "cellar",
-            "commission_free": "commission_free",
-        }
-
-        for llm_key, apt_field in boolean_fields.items():
-            if llm_key in data and data[llm_key] is not None:
-                current_value = getattr(apartment, apt_field)
-                if current_value is None:
-                    setattr(apartment, apt_field, data[llm_key])
-                    fields_added.append(f"{apt_field}={data[llm_key]}")
+        for field in _LLM_BOOLEAN_FIELDS:
+            llm_value = data.get(field)
+            if llm_value is not None and getattr(apartment, field) is None:
+                setattr(apartment, field, llm_value)
+                fields_added.append(f"{field}={llm_value}")
 
         # Logging summary
         if fields_added:
             logger.info(f"LLM added {len(fields_added)} fields: {', '.join(fields_added[:10])}")
         if fields_replaced:
             logger.info(f"LLM replaced {len(fields_replaced)} suspicious values: {', '.join(fields_replaced)}")
-        if fields_kept and self.config.get("llm_settings", {}).get("diagnostics_enabled"):
+        if fields_kept and self.diagnostics_enabled:
             logger.debug(f"LLM kept {len(fields_kept)} existing values")
 
         # Address from LLM
@@ -770,97 +1134,69 @@ class EnhancedApartmentScraper:
             parsed = self.address_parser.parse_address(data["address"])
             self._apply_address_data(apartment, parsed)
 
-    def _has_missing_fields(self, apartment: ApartmentListing) -> bool:
-        """Check if apartment has important missing fields."""
-        # Categorized by user priority: Financial > Features > Address
-
-        # Financial fields (HIGHEST PRIORITY)
-        financial_fields = [
-            "betriebskosten_monthly",
-            "reparaturrucklage",
-            "heating_cost_monthly",
-            "price_per_sqm",
-        ]
+    def _llm_cache_key(
+        self,
+        listing_id: str,
+        json_ld_data: Optional[Dict[str, Any]],
+        existing_data: Dict[str, Any],
+        html: str,
+    ) -> str:
+        """
+        Build the LLM cache key for a listing.
 
-        # Property features
-        feature_fields = [
-            "bedrooms",
-            "bathrooms",
-            "elevator",
-            "balcony",
-            "terrace",
-            "garden",
-            "parking",
-            "cellar",
-            "commission_free",
-        ]
+        The rendered page HTML carries per-request content, so it would
+        almost never repeat across runs. The key digests the listing's
+        JSON-LD Product block and the prompt's existing data instead, and
+        only falls back to the HTML for pages without JSON-LD.
 
-        # Address details
-        address_fields = [
-            "postal_code",
-            "city",
-            "street",
-            "house_number",
-            "district",
-        ]
+        Args:
+            listing_id: Listing ID
+            json_ld_data: Raw JSON-LD Product data, if the page had any
+            existing_data: Field values sent to the LLM with the page
+            html: Listing page HTML
 
-        # Other important fields
-        other_fields = [
-            "rooms",
-            "year_built",
-            "condition",
-            "energy_rating",
-            "hwb_value",
-        ]
+        Returns:
+            "<model>:<listing_id>:<digest>" cache key
+        """
+        if json_ld_data:
+            content = json.dumps(
+                [json_ld_data, existing_data], sort_keys=True, ensure_ascii=False, default=str
+            )
+        else:
+            content = html
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self.llm_extractor.model}:{listing_id}:{digest}"
 
+    def _has_missing_fields(self, apartment: ApartmentListing) -> bool:
+        """Check if apartment has important missing fields."""
         # Check each category and log which triggered LLM
-        missing_financial = [f for f in financial_fields if getattr(apartment, f) is None]
-        missing_features = [f for f in feature_fields if getattr(apartment, f) is None]
-        missing_address = [f for f in address_fields if getattr(apartment, f) is None]
-        missing_other = [f for f in other_fields if getattr(apartment, f) is None]
-
-        has_missing = bool(missing_financial or missing_features or missing_address or missing_other)
-
-        if has_missing:
-            categories = []
-            if missing_financial:
-                categories.append(f"financial({len(missing_financial)})")
-            if missing_features:
-                categories.append(f"features({len(missing_features)})")
-            if missing_address:
-                categories.append(f"address({len(missing_address)})")
-            if missing_other:
-                categories.append(f"other({len(missing_other)})")
+        categories = []
+        for category, get_fields in _MISSING_FIELD_GETTERS:
+            missing = sum(1 for value in get_fields(apartment) if value is None)
+            if missing:
+                categories.append(f"{category}({missing})")
+
+        if categories:
             logger.info(f"LLM extraction triggered - missing: {', '.join(categories)}")
 
-        return has_missing
+        return bool(categories)
 
     def _extract_address_from_html(self, html: str, url: str) -> Optional[str]:
         """Extract address from HTML or URL."""
-        # Strategy 1: Look for address in JSON-LD
-        json_ld_match = re.search(
-            r'"address"[:\s]*\{[^}]*"streetAddress"[:\s]*"([^"]+)"', html
+        # Strategy 1: Look for address in JSON-LD (substring probe first)
+        json_ld_match = (
+            _JSON_LD_STREET_ADDRESS_RE.search(html) if '"streetAddress"' in html else None
         )
         if json_ld_match:
             addr = json_ld_match.group(1).strip()
             # Only return if it looks like a real address (has street name or postal code)
-            if re.search(r"\d{4}|straße|gasse|weg|platz", addr, re.IGNORECASE):
+            if _ADDRESS_HINT_RE.search(addr):
                 return addr
 
         # Strategy 2: Look for address in structured data attributes
         # willhaben often has address in data attributes or specific divs
-        address_patterns = [
-            # Full address with street, postal code and city
-            r"([A-Za-zäöüÄÖÜß\-]+(?:straße|gasse|weg|platz|ring|allee)\s+\d+[^,<]*,\s*\d{4}\s+[A-Za-zäöüÄÖÜß\s]+)",
-            # Postal code + city pattern (more cities)
-            r"(\d{4})\s+(Wien|Graz|Linz|Salzburg|Innsbruck|Klagenfurt|Villach|St\.\s*Pölten|Wels|Dornbirn|Steyr|Wiener\s*Neustadt|Feldkirch|Bregenz)[^<]*",
-            # Address label patterns
-            r"(?:Adresse|Standort|Lage)[:\s]*</[^>]+>\s*<[^>]+>([^<]+)",
-            r"(?:Adresse|Standort|Lage)[:\s]*([^<\n]{10,80})",
-        ]
-
-        for pattern in address_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _ADDRESS_PATTERNS:
+            match = pattern.search(html)
             if match:
                 addr = (
                     match.group(1).strip()
@@ -868,45 +1204,20 @@ class EnhancedApartmentScraper:
                     else match.group(0).strip()
                 )
                 # Clean up HTML entities and extra whitespace
-                addr = re.sub(r"\s+", " ", addr)
+                addr = _WHITESPACE_RE.sub(" ", addr)
                 addr = addr.replace("&nbsp;", " ").strip()
                 if len(addr) > 5 and len(addr) < 200:
                     return addr
 
         # Strategy 3: Extract from URL
-        # Pattern: /wien-1030-landstrasse/ or /kaernten/klagenfurt/
-        url_patterns = [
-            # Vienna with postal code: /wien-1030-landstrasse/
-            (
-                r"/wien-(\d{4})-([^/]+)",
-                lambda m: f"{m.group(1)} Wien",
-            ),
-            # Other cities with postal code: /1030-landstrasse/
-            (
-                r"/(\d{4})-([^/]+)",
-                lambda m: f"{m.group(1)}",
-            ),
-            # State/City format: /kaernten/villach/ or /wien/leopoldstadt/
-            (
-                r"/(?:kaernten|kärnten)/([a-z\-]+)/",
-                lambda m: f"{m.group(1).replace('-', ' ').title()}, Kärnten",
-            ),
-            (
-                r"/(?:steiermark)/([a-z\-]+)/",
-                lambda m: f"{m.group(1).replace('-', ' ').title()}, Steiermark",
-            ),
-            (
-                r"/(?:tirol)/([a-z\-]+)/",
-                lambda m: f"{m.group(1).replace('-', ' ').title()}, Tirol",
-            ),
-            (
-                r"/wien/([a-z\-]+)/",
-                lambda m: "Wien",
-            ),
-        ]
-
-        for pattern, formatter in url_patterns:
-            match = re.search(pattern, url.lower())
+        postal_code = _vienna_postal_code_from_url(url)
+        if postal_code:
+            return f"{postal_code} Wien"
+        url_lower = url.lower()
+        for probes, pattern, formatter in _URL_ADDRESS_PATTERNS:
+            if not any(probe in url_lower for probe in probes):
+                continue
+            match = pattern.search(url)
             if match:
                 return formatter(match)
 
@@ -914,19 +1225,24 @@ class EnhancedApartmentScraper:
 
     def _extract_title(self, html: str) -> Optional[str]:
         """Extract title from HTML."""
-        # Try h1 tag
-        h1_match = re.search(r"<h1[^>]*>([^<]+)</h1>", html, re.IGNORECASE)
-        if h1_match:
-            title = h1_match.group(1).strip()
-            if len(title) > 5 and "cookie" not in title.lower():
-                return title
-
-        # Try og:title meta
-        og_match = re.search(
-            r'<meta property="og:title" content="([^"]+)"', html, re.IGNORECASE
-        )
-        if og_match:
-            return og_match.group(1).strip()
+        # Try h1 tag (substring probe first; regex scan starts at the tag)
+        h1_start = html.find("<h1")
+        if h1_start != -1:
+            h1_match = _H1_RE.search(html, h1_start)
+            if h1_match:
+                title = h1_match.group(1).strip()
+                if len(title) > 5 and "cookie" not in title.lower():
+                    return title
+
+        # Try og:title meta (meta tags live in <head>, so don't scan the body)
+        head_end = html.find("</head>")
+        if head_end == -1:
+            head_end = len(html)
+        og_start = html.find('<meta property="og:title"', 0, head_end)
+        if og_start != -1:
+            og_match = _OG_TITLE_RE.search(html, og_start, head_end)
+            if og_match:
+                return og_match.group(1).strip()
 
         return None
 
@@ -997,7 +1313,7 @@ class EnhancedApartmentScraper:
 
         # Location component - use "nv" for missing city
         if apartment.city:
-            city_clean = re.sub(r'[^\w\s-]', '', apartment.city).strip().replace(' ', '_')
+            city_clean = _FILENAME_UNSAFE_RE.sub('', apartment.city).strip().replace(' ', '_')
         else:
             city_clean = "nv"
 
@@ -1005,7 +1321,7 @@ class EnhancedApartmentScraper:
         if apartment.district_number:
             district_str = f"_{apartment.district_number}"
         elif apartment.district:
-            district_clean = re.sub(r'[^\w\s-]', '', apartment.district).strip().replace(' ', '_')
+            district_clean = _FILENAME_UNSAFE_RE.sub('', apartment.district).strip().replace(' ', '_')
             district_str = f"_{district_clean}"
         else:
             district_str = "_nv"
@@ -1037,8 +1353,6 @@ class EnhancedApartmentScraper:
         Returns:
             Absolute filepath of written file (empty string if write failed)
         """
-        import yaml
-
         try:
             # Generate filename
             filename = self._generate_filename_with_score(apartment, validation_failed)
@@ -1061,26 +1375,25 @@ class EnhancedApartmentScraper:
                 default_flow_style=False
             )
 
-            # Generate markdown body
-            body_lines = []
+            # Frontmatter and markdown body are joined into the file content once
+            content_lines = ["---", frontmatter + "---", ""]
 
             # Add validation warning banner if needed
             if validation_failed:
-                body_lines.append("> **⚠️ WARNUNG: Validierung fehlgeschlagen**")
-                body_lines.append(f"> {validation_reason}")
-                body_lines.append(">")
-                body_lines.append("> Alle extrahierten Daten wurden dennoch gespeichert für manuelle Prüfung.")
-                body_lines.append("")
+                content_lines.append("> **⚠️ WARNUNG: Validierung fehlgeschlagen**")
+                content_lines.append(f"> {validation_reason}")
+                content_lines.append(">")
+                content_lines.append("> Alle extrahierten Daten wurden dennoch gespeichert für manuelle Prüfung.")
+                content_lines.append("")
 
             # Generate normal markdown content
             md_content = self.md_generator.generate_markdown_content(apartment)
-            body_lines.append(md_content)
-
-            body = "\n".join(body_lines)
+            content_lines.append(md_content)
 
-            # Write atomically (temp file + rename)
-            temp_path = filepath.with_suffix('.tmp')
-            full_content = f"---\n{frontmatter}---\n\n{body}"
+            # Write atomically (temp file + rename); the temp name is per listing
+            # because concurrent listings can map to the same target filename
+            temp_path = filepath.with_suffix(f'.{apartment.listing_id}.tmp')
+            full_content = "\n".join(content_lines)
 
             with open(temp_path, 'w', encoding='utf-8') as f:
                 f.write(full_content)
@@ -1101,41 +1414,152 @@ class EnhancedApartmentScraper:
             logger.error(f"Failed to write apartment {apartment.listing_id}: {e}")
             return ""
 
-    async def process_apartment(
-        self, crawler: AsyncWebCrawler, url: str
-    ) -> Optional[ApartmentMetadata]:
+    def _reached_max_apartments(self) -> bool:
+        """Check whether the max_apartments cap is taken by finished and in-progress listings."""
+        return bool(self.max_apartments) and (
+            len(self.apartment_metadata) + self._apartments_in_progress >= self.max_apartments
+        )
+
+    def _get_rate_limiter(self, url: str) -> TokenBucketLimiter:
         """
-        Fetch and process a single apartment listing.
+        Get the rate limiter for the host of a URL, creating it on first use.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            TokenBucketLimiter shared by all requests to that host
+        """
+        host = urlsplit(url).netloc
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            rate = 1.0 / self.delay_apartment if self.delay_apartment > 0 else 10.0
+            limiter = TokenBucketLimiter(rate=rate, burst=self.rate_burst)
+            self._rate_limiters[host] = limiter
+        return limiter
+
+    async def _crawl(
+        self, crawler: AsyncWebCrawler, url: str, config: CrawlerRunConfig
+    ):
+        """
+        Fetch a URL through the per-host rate limiter.
+
+        Retries with exponential backoff on HTTP 429 or crawler exceptions and
+        halves the host's request rate each time it gets throttled. Rate limit
+        headers (Retry-After, X-RateLimit-*) pause the host's limiter for as
+        long as the server asks.
 
         Args:
             crawler: The web crawler instance
+            url: URL to fetch
+            config: Crawl settings for this request
+
+        Returns:
+            CrawlResult of the last attempt
+        """
+        limiter = self._get_rate_limiter(url)
+
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            backoff = self.backoff_base * 2**attempt
+            try:
+                result = await crawler.arun(url=url, config=config)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f"Crawl error for {url} (attempt {attempt + 1}): {e}")
+                limiter.slow_down()
+                await asyncio.sleep(backoff)
+                continue
+
+            # Honor Retry-After / X-RateLimit-* hints on every response
+            requested_wait = limiter.update_from_headers(
+                getattr(result, "response_headers", None)
+            )
+            if getattr(result, "status_code", None) != 429 or attempt == self.max_retries:
+                return result
+            logger.warning(f"Rate limited (HTTP 429) on {url} (attempt {attempt + 1})")
+
+            # Throttling applies to the whole host, so hold back every request to it
+            limiter.slow_down()
+            if requested_wait is None:
+                limiter.pause(backoff)
+
+    def _claim_listing(self, url: str) -> Optional[str]:
+        """
+        Mark a listing as seen unless it was already claimed this run.
+
+        Check and insert happen without an await in between, so concurrent
+        tasks can never both claim the same listing.
+
+        Args:
             url: Apartment listing URL
 
         Returns:
-            Processed ApartmentListing or None if failed/filtered
+            Listing ID if the listing is new, None for duplicates
         """
+        # Cheap exact-URL dedup before parsing the listing ID
+        if url in self.seen_urls:
+            logger.debug(f"Skipping duplicate URL: {url}")
+            return None
+        self.seen_urls.add(url)
+
         listing_id = self.extract_listing_id(url)
+        listing_key = int(listing_id)
 
         # Check for duplicates
-        if listing_id in self.seen_listings:
+        if listing_key in self.seen_listings:
             logger.debug(f"Skipping duplicate: {listing_id}")
             return None
 
-        self.seen_listings.add(listing_id)
+        self.seen_listings.add(listing_key)
+        return listing_id
 
-        try:
-            result = await crawler.arun(
-                url=url,
-                wait_for="css:main",
-                delay_before_return_html=2.0,
-            )
+    async def process_apartment(
+        self, crawler: AsyncWebCrawler, url: str, listing_id: Optional[str] = None
+    ) -> Optional[ApartmentMetadata]:
+        """
+        Fetch and process a single apartment listing.
+
+        Args:
+            crawler: The web crawler instance
+            url: Apartment listing URL
+            listing_id: ID of a listing already claimed via _claim_listing
+                (claimed here when omitted)
+
+        Returns:
+            Processed ApartmentListing or None if failed/filtered
+        """
+        if self._reached_max_apartments():
+            return None
 
-            if not result.success:
-                logger.warning(f"Failed to fetch: {url}")
+        if listing_id is None:
+            listing_id = self._claim_listing(url)
+            if listing_id is None:
                 return None
 
+        # Reserve a slot under max_apartments before the first await, so
+        # concurrent listings can't all pass the check above together; the
+        # finally clause hands it back whether or not the listing is written
+        self._apartments_in_progress += 1
+        try:
+            html = None
+            if self.fast_detail_pages and self._http_client is not None:
+                html = await self._fetch_html_http(url)
+                if html is not None and html.find(_STAR_ICON_PATH) == -1:
+                    logger.debug(f"No star icon in HTTP response, using browser: {url}")
+                    html = None
+
+            if html is None:
+                result = await self._crawl(crawler, url, self._detail_run_config)
+
+                if not result.success:
+                    logger.warning(f"Failed to fetch: {url}")
+                    return None
+                html = result.html
+
             # Extract apartment data
-            apartment = await self.extract_apartment_data(result.html, url)
+            apartment = await self.extract_apartment_data(html, url)
             if not apartment:
                 return None
 
@@ -1157,11 +1581,12 @@ class EnhancedApartmentScraper:
             # Generate LLM summary if enabled (only for valid apartments)
             if is_valid and self.generate_llm_summary and self.summarizer:
                 try:
-                    summary_timeout = self.config.get("llm_settings", {}).get("summary_timeout", 120)
-                    summary = await asyncio.wait_for(
-                        self.summarizer.generate_summary(apartment),
-                        timeout=summary_timeout,  # Use configured timeout (was 90s, now 120s)
-                    )
+                    summary_timeout = self.summary_timeout
+                    async with self._llm_semaphore:
+                        summary = await asyncio.wait_for(
+                            self.summarizer.generate_summary(apartment),
+                            timeout=summary_timeout,  # Use configured timeout (was 90s, now 120s)
+                        )
                     if summary:
                         apartment.llm_summary = summary
                         apartment.llm_summary_generated_at = datetime.now()
@@ -1172,7 +1597,9 @@ class EnhancedApartmentScraper:
                     logger.warning(f"Summary generation failed for {listing_id}: {e}")
 
             # NEW: Write immediately to disk (ALL apartments, including validation failures)
-            filepath = self._write_apartment_immediately(
+            # Runs in a worker thread so YAML dumping and file I/O don't block the event loop
+            filepath = await asyncio.to_thread(
+                self._write_apartment_immediately,
                 apartment,
                 validation_failed=not is_valid,
                 validation_reason=validation_reason
@@ -1203,29 +1630,74 @@ class EnhancedApartmentScraper:
         except Exception as e:
             logger.error(f"Error processing {url}: {e}")
             return None
+        finally:
+            self._apartments_in_progress -= 1
 
-    async def scrape_page(
-        self, crawler: AsyncWebCrawler, page: int
-    ) -> List[ApartmentMetadata]:
+    async def _process_listing(
+        self,
+        crawler: AsyncWebCrawler,
+        url: str,
+        listing_id: str,
+        position: int,
+        total: int,
+    ) -> Optional[ApartmentMetadata]:
         """
-        Scrape a single page of listings.
+        Process one listing of a page once a concurrency slot is free.
 
         Args:
             crawler: The web crawler instance
-            page: Page number to scrape
+            url: Apartment listing URL
+            listing_id: ID of the (already claimed) listing
+            position: 1-based position of the listing on its page
+            total: Number of listings on the page
 
         Returns:
-            List of apartment metadata from this page
+            ApartmentMetadata or None if skipped/failed/filtered
+        """
+        async with self._apartment_semaphore:
+            # Check for interrupt/limit before starting this apartment
+            if self.interrupted or self._reached_max_apartments():
+                return None
+
+            logger.info(
+                f"  [{position}/{total}] Processing apartment "
+                f"(Total so far: {len(self.apartment_metadata)}): {url}"
+            )
+            try:
+                return await self.process_apartment(crawler, url, listing_id)
+            except Exception as e:
+                # Keep one broken listing from cancelling the rest of the page
+                logger.error(f"Error processing {url}: {e}")
+                return None
+
+    async def fetch_listing_page(
+        self, crawler: AsyncWebCrawler, page: int, delay: float = 0.0
+    ) -> List[Dict[str, str]]:
+        """
+        Fetch a search results page and extract its listing URLs.
+
+        Args:
+            crawler: The web crawler instance
+            page: Page number to fetch
+            delay: Seconds to wait before fetching (delay between pages)
+
+        Returns:
+            List of listing dicts with "url" keys (empty if the fetch failed)
         """
+        if delay:
+            await asyncio.sleep(delay)
+
         url = self.build_willhaben_url(page)
         logger.info(f"Scraping page {page}: {url}")
 
-        result = await crawler.arun(
-            url=url,
-            wait_for="css:section",
-            delay_before_return_html=3.0,
-            js_code="window.scrollTo(0, document.body.scrollHeight);",
-        )
+        if self.fast_search_pages and self._http_client is not None:
+            listings = await self._fetch_listing_urls_http(url)
+            if listings:
+                logger.info(f"Found {len(listings)} listings on page {page} (HTTP)")
+                return listings
+            logger.debug(f"No listings via HTTP for page {page}, using browser")
+
+        result = await self._crawl(crawler, url, self._search_run_config)
 
         if not result.success:
             logger.error(f"Failed to scrape page {page}: {result.error_message}")
@@ -1234,34 +1706,117 @@ class EnhancedApartmentScraper:
         # Extract listing URLs
         listings = self.extract_listing_urls(result.html)
         logger.info(f"Found {len(listings)} listings on page {page}")
+        return listings
+
+    async def _fetch_listing_urls_http(self, url: str) -> List[Dict[str, str]]:
+        """
+        Fetch a search results page without the browser and extract its listings.
 
-        if not listings:
+        Args:
+            url: Search results page URL
+
+        Returns:
+            List of listing dicts with "url" keys (empty on any failure)
+        """
+        html = await self._fetch_html_http(url)
+        if html is None:
             return []
+        return self.extract_listing_urls(html)
 
-        # Process each listing
-        page_apartments = []
-        total_so_far = len(self.apartment_metadata)
-        for i, listing in enumerate(listings, 1):
-            # Check for interrupt before processing next apartment
-            if self.interrupted:
-                logger.warning(f"Interrupt detected - stopping page {page} after {i-1}/{len(listings)} apartments")
-                break
+    async def _fetch_html_http(self, url: str) -> Optional[str]:
+        """
+        Fetch a page with the pooled plain HTTP client.
 
-            listing_url = listing["url"]
-            logger.info(
-                f"  [{i}/{len(listings)}] Processing apartment (Total so far: {total_so_far}): {listing_url}"
-            )
+        Args:
+            url: Page URL
+
+        Returns:
+            Page HTML, or None on any failure or non-200 status (a 429 also
+            slows down and pauses the host's limiter)
+        """
+        limiter = self._get_rate_limiter(url)
+        await limiter.acquire()
+        try:
+            response = await self._http_client.get(url)
+        except httpx.HTTPError as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+        requested_wait = limiter.update_from_headers(response.headers)
+        if response.status_code == 429:
+            logger.warning(f"Rate limited (HTTP 429) on {url} via HTTP")
+            # Same handling as _crawl: the browser fallback goes through this
+            # host's limiter too, so it waits out Retry-After or the backoff
+            limiter.slow_down()
+            if requested_wait is None:
+                limiter.pause(self.backoff_base)
+            return None
+        if response.status_code != 200:
+            logger.debug(f"HTTP fetch of {url} returned status {response.status_code}")
+            return None
+        return response.text
+
+    async def process_listings(
+        self, crawler: AsyncWebCrawler, page: int, listings: List[Dict[str, str]]
+    ) -> List[ApartmentMetadata]:
+        """
+        Process the listings of one search results page.
+
+        Args:
+            crawler: The web crawler instance
+            page: Page number the listings came from
+            listings: Listing dicts with "url" keys
+
+        Returns:
+            List of apartment metadata from this page
+        """
+        # Drop listings already seen this run before any task is scheduled
+        new_listings = []
+        for listing in listings:
+            listing_id = self._claim_listing(listing["url"])
+            if listing_id is not None:
+                new_listings.append((listing_id, listing["url"]))
+
+        if not new_listings:
+            return []
+
+        # Process listings concurrently; the semaphore bounds in-flight apartments
+        # and the per-host rate limiter spaces out the actual requests
+        # The task group cancels in-flight listings if the page itself is cancelled
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(
+                    self._process_listing(crawler, url, listing_id, i, len(new_listings))
+                )
+                for i, (listing_id, url) in enumerate(new_listings, 1)
+            ]
 
-            metadata = await self.process_apartment(crawler, listing_url)
-            if metadata:
-                page_apartments.append(metadata)
-                total_so_far = len(self.apartment_metadata)
+        page_apartments = [outcome for outcome in (task.result() for task in tasks) if outcome]
 
-            # Rate limiting
-            await asyncio.sleep(self.delay_apartment)
+        if self.interrupted:
+            logger.warning(
+                f"Interrupt detected - stopped page {page} after "
+                f"{len(page_apartments)}/{len(listings)} apartments"
+            )
 
         return page_apartments
 
+    async def scrape_page(
+        self, crawler: AsyncWebCrawler, page: int
+    ) -> List[ApartmentMetadata]:
+        """
+        Scrape a single page of listings.
+
+        Args:
+            crawler: The web crawler instance
+            page: Page number to scrape
+
+        Returns:
+            List of apartment metadata from this page
+        """
+        listings = await self.fetch_listing_page(crawler, page)
+        return await self.process_listings(crawler, page, listings)
+
     async def run(self) -> List[ApartmentMetadata]:
         """
         Run the full scraping process with immediate disk writing.
@@ -1284,39 +1839,96 @@ class EnhancedApartmentScraper:
 
         try:
             async with AsyncWebCrawler(headless=True, verbose=False) as crawler:
-                while True:
-                    # Check for interrupt signal
-                    if self.interrupted:
-                        logger.warning("Extraction stopped by user interrupt")
-                        break
-
-                    # Check page limit
-                    if max_pages and page > max_pages:
-                        logger.info(f"Reached max page limit ({max_pages})")
-                        break
-
-                    # Scrape page
-                    page_apartments = await self.scrape_page(crawler, page)
-
-                    if page_apartments:
-                        consecutive_empty_pages = 0
-                        logger.info(
-                            f"Page {page}: {len(page_apartments)} apartments "
-                            f"(Total: {len(self.apartment_metadata)})"
-                        )
-                    else:
-                        consecutive_empty_pages += 1
-                        logger.info(
-                            f"Page {page}: Empty ({consecutive_empty_pages}/{max_consecutive_empty})"
-                        )
+                if self.fast_search_pages or self.fast_detail_pages:
+                    # One pooled keep-alive client for all plain HTTP fetches of
+                    # the run, sized for the concurrent detail page fetches
+                    self._http_client = httpx.AsyncClient(
+                        headers={"User-Agent": _HTTP_USER_AGENT},
+                        timeout=httpx.Timeout(15.0),
+                        limits=httpx.Limits(
+                            max_connections=self.max_concurrent_apartments + 1,
+                            max_keepalive_connections=self.max_concurrent_apartments + 1,
+                            keepalive_expiry=30.0,
+                        ),
+                        follow_redirects=True,
+                    )
+                next_page_fetch: Optional[asyncio.Task] = None
+
+                try:
+                    while True:
+                        # Check for interrupt signal
+                        if self.interrupted:
+                            logger.warning("Extraction stopped by user interrupt")
+                            break
 
-                        if consecutive_empty_pages >= max_consecutive_empty:
-                            logger.info("Stopping: consecutive empty pages limit reached")
+                        # Check page limit
+                        if max_pages and page > max_pages:
+                            logger.info(f"Reached max page limit ({max_pages})")
                             break
 
-                    # Rate limiting between pages
-                    await asyncio.sleep(self.delay_page)
-                    page += 1
+                        if self._reached_max_apartments():
+                            logger.info(f"Reached max apartments limit ({self.max_apartments})")
+                            break
+
+                        if next_page_fetch is None:
+                            # First page, or the next page was not prefetched last round
+                            next_page_fetch = asyncio.create_task(
+                                self.fetch_listing_page(
+                                    crawler, page, delay=self.delay_page if page > 1 else 0.0
+                                )
+                            )
+                        listings = await next_page_fetch
+
+                        # Prefetch the next search page (after the page delay) while
+                        # this page's apartments are being processed. Skip it when
+                        # the page limit, an interrupt, the empty pages limit or this
+                        # page's listings may end the run; the loop then fetches the
+                        # page only if needed
+                        next_page_fetch = None
+                        if not (
+                            self.interrupted
+                            or (max_pages and page + 1 > max_pages)
+                            or (
+                                not listings
+                                and consecutive_empty_pages + 1 >= max_consecutive_empty
+                            )
+                            or (
+                                self.max_apartments
+                                and len(self.apartment_metadata) + len(listings)
+                                >= self.max_apartments
+                            )
+                        ):
+                            next_page_fetch = asyncio.create_task(
+                                self.fetch_listing_page(crawler, page + 1, delay=self.delay_page)
+                            )
+
+                        page_apartments = await self.process_listings(crawler, page, listings)
+
+                        if page_apartments:
+                            consecutive_empty_pages = 0
+                            logger.info(
+                                f"Page {page}: {len(page_apartments)} apartments "
+                                f"(Total: {len(self.apartment_metadata)})"
+                            )
+                        else:
+                            consecutive_empty_pages += 1
+                            logger.info(
+                                f"Page {page}: Empty ({consecutive_empty_pages}/{max_consecutive_empty})"
+                            )
+
+                            if consecutive_empty_pages >= max_consecutive_empty:
+                                logger.info("Stopping: consecutive empty pages limit reached")
+                                break
+
+                        page += 1
+                finally:
+                    # Drop a prefetch that is no longer needed before the browser closes
+                    if next_page_fetch:
+                        next_page_fetch.cancel()
+                        await asyncio.gather(next_page_fetch, return_exceptions=True)
+                    if self._http_client is not None:
+                        await self._http_client.aclose()
+                        self._http_client = None
 
         except Exception as e:
             # Handle browser cleanup errors gracefully (common after interrupt)
@@ -1325,6 +1937,13 @@ class EnhancedApartmentScraper:
             else:
                 # Re-raise unexpected errors
                 raise
+        finally:
+            # Flush and close the LLM cache shelf even when the crawl fails
+            if self._llm_cache is not None:
+                self._llm_cache.close()
+
+        if self.skip_seen_listings:
+            self._save_seen_listings()
 
         # Log completion status
         if self.interrupted:
@@ -1338,14 +1957,24 @@ class EnhancedApartmentScraper:
                 logger.warning("No apartments collected - summary will be empty!")
             else:
                 logger.info(f"Generating summary for {len(self.apartment_metadata)} apartments")
-            self._generate_complete_summary()
+            # Formatting and file I/O run in a worker thread, off the event loop
+            await asyncio.to_thread(self._generate_complete_summary)
 
-            # Generate PDF with top N apartments
+            # Generate PDF with top N apartments (layout and file I/O in a
+            # worker thread as well)
             if self.config.get("output", {}).get("generate_pdf", True):
-                self._generate_pdf_report()
+                await asyncio.to_thread(self._generate_pdf_report)
 
         return self.apartment_metadata
 
+    def _save_seen_listings(self) -> None:
+        """Persist the IDs of all apartments written so far (this and earlier runs)."""
+        seen = self._previously_seen | {int(m.listing_id) for m in self.apartment_metadata}
+        self._seen_listings_path.write_text(
+            "\n".join(str(key) for key in sorted(seen)), encoding="utf-8"
+        )
+        logger.info(f"Saved {len(seen)} seen listing IDs to {self._seen_listings_path}")
+
     def _generate_complete_summary(self) -> None:
         """
         Generate summary.md with ALL apartments (sorted by score).
@@ -1376,8 +2005,11 @@ class EnhancedApartmentScraper:
         valid_count = sum(1 for m in sorted_metadata if not m.validation_failed)
         failed_count = total - valid_count
 
+        # Validation failures sort last, so valid/failed split at a single boundary
+        failed_start = valid_count
+
         # Average scores (only valid apartments)
-        valid_metadata = [m for m in sorted_metadata if not m.validation_failed and m.investment_score is not None]
+        valid_metadata = [m for m in sorted_metadata[:failed_start] if m.investment_score is not None]
         avg_score = sum(m.investment_score for m in valid_metadata) / valid_count if valid_count > 0 else 0
 
         # Average yield (only valid apartments)
@@ -1387,6 +2019,9 @@ class EnhancedApartmentScraper:
         # City breakdown
         city_counts = Counter(m.city for m in sorted_metadata if m.city)
 
+        # Format display strings once; both tables read from these rows
+        rows = self._build_summary_rows(sorted_metadata)
+
         # Generate report
         timestamp = self.run_timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
@@ -1432,27 +2067,21 @@ class EnhancedApartmentScraper:
                 "|-----|-------|-------|-------|----------|------|---------|",
             ])
 
-            failed_metadata = [m for m in sorted_metadata if m.validation_failed]
-            for idx, meta in enumerate(failed_metadata, 1):
+            failed = zip(sorted_metadata[failed_start:], rows[failed_start:])
+            for idx, (meta, row) in enumerate(failed, 1):
                 reason = meta.validation_reason or "Unbekannter Validierungsfehler"
                 price_str = f"€{meta.price:,.0f}" if meta.price else "❌ fehlt"
                 size_str = f"{meta.size_sqm:.0f}m²" if meta.size_sqm and meta.size_sqm >= 10 else "❌ fehlt"
 
-                # Try to get betriebskosten from listing if available (not in metadata)
-                bk_str = "n/a"  # Metadata doesn't have this field
-
-                location_parts = []
-                if meta.postal_code:
-                    location_parts.append(meta.postal_code)
-                if meta.city:
-                    location_parts.append(meta.city)
-                location = " ".join(location_parts) if location_parts else "n/a"
-
-                details_link = f"[Details](apartments/{meta.filename})"
-
-                content.append(
-                    f"| {idx} | {reason} | {price_str} | {size_str} | {bk_str} | {location} | {details_link} |"
-                )
+                content.append(_FAILED_ROW_TEMPLATE.format_map({
+                    "idx": idx,
+                    "reason": reason,
+                    "price": price_str,
+                    "size": size_str,
+                    "bk": "n/a",  # Metadata doesn't have betriebskosten
+                    "location": row.location,
+                    "details": row.details,
+                }))
 
             content.append("")
 
@@ -1463,6 +2092,32 @@ class EnhancedApartmentScraper:
             "|------|--------|-----------|------------|-------|-------|---------|------|---------|",
         ])
 
+        # Write summary; the (unbounded) main table is streamed row by row
+        # instead of being joined into one large string first
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(content))
+            f.write("\n")
+            f.writelines(
+                f"{_SUMMARY_ROW_TEMPLATE.format_map(row._asdict())}\n" for row in rows
+            )
+            f.write("\n---\n\n*Generiert mit noessi-crawl*")
+
+        logger.info(f"Complete summary saved: {summary_path} ({len(sorted_metadata)} apartments, {failed_count} failed)")
+
+    def _build_summary_rows(self, sorted_metadata: List[ApartmentMetadata]) -> List[SummaryRow]:
+        """
+        Format the summary table strings for each apartment.
+
+        Args:
+            sorted_metadata: Metadata in summary order (rank = position + 1)
+
+        Returns:
+            List of SummaryRow, one per metadata entry
+        """
+        # Local alias: looked up once per row below
+        recommendations = RECOMMENDATIONS
+
+        rows = []
         for rank, meta in enumerate(sorted_metadata, 1):
             # Status indicator
             if meta.validation_failed:
@@ -1473,12 +2128,7 @@ class EnhancedApartmentScraper:
                 score_str = f"{meta.investment_score:.1f}" if meta.investment_score is not None else "n/a"
 
             recommendation = meta.recommendation or "n/a"
-            if recommendation in RECOMMENDATIONS:
-                recommendation = RECOMMENDATIONS[recommendation]
-
-            price_str = f"€{meta.price:,.0f}" if meta.price else "n/a"
-            size_str = f"{meta.size_sqm:.0f}m²" if meta.size_sqm else "n/a"
-            yield_str = f"{meta.gross_yield:.1f}%" if meta.gross_yield else "n/a"
+            recommendation = recommendations.get(recommendation, recommendation)
 
             # Location string
             location_parts = []
@@ -1486,23 +2136,20 @@ class EnhancedApartmentScraper:
                 location_parts.append(meta.postal_code)
             if meta.city:
                 location_parts.append(meta.city)
-            location = " ".join(location_parts) if location_parts else "n/a"
-
-            # Details link to apartments/ subfolder
-            details_link = f"[Details](apartments/{meta.filename})"
-
-            content.append(
-                f"| {rank} | {status} | {score_str} | {recommendation} | {price_str} | "
-                f"{size_str} | {yield_str} | {location} | {details_link} |"
-            )
-
-        content.extend(["", "---", "", "*Generiert mit noessi-crawl*"])
 
-        # Write summary
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(content))
-
-        logger.info(f"Complete summary saved: {summary_path} ({len(sorted_metadata)} apartments, {failed_count} failed)")
+            rows.append(SummaryRow(
+                rank=rank,
+                status=status,
+                score=score_str,
+                recommendation=recommendation,
+                price=f"€{meta.price:,.0f}" if meta.price else "n/a",
+                size=f"{meta.size_sqm:.0f}m²" if meta.size_sqm else "n/a",
+                yield_=f"{meta.gross_yield:.1f}%" if meta.gross_yield else "n/a",
+                location=" ".join(location_parts) if location_parts else "n/a",
+                # Details link to apartments/ subfolder
+                details=f"[Details](apartments/{meta.filename})",
+            ))
+        return rows
 
     def _generate_pdf_report(self) -> None:
         """Generate PDF report with top N apartments (from TopNTracker)."""
@@ -1518,6 +2165,9 @@ class EnhancedApartmentScraper:
         pdf_path = self.run_folder / pdf_filename
 
         try:
+            # Imported lazily: fpdf and font loading are only needed when a PDF is written
+            from utils.pdf_generator import PDFGenerator
+
             # Initialize PDF generator
             pdf_generator = PDFGenerator(
                 output_dir=str(self.run_folder),
@@ -1579,19 +2229,24 @@ class EnhancedApartmentScraper:
         }
 
         try:
-            with open(diagnostic_file, "w", encoding="utf-8") as f:
-                json.dump(diagnostic_data, f, indent=2, ensure_ascii=False, default=str)
+            diagnostic_file.write_bytes(json_utils.dumps_pretty(diagnostic_data))
 
             logger.debug(f"Saved diagnostic data to {diagnostic_file}")
         except Exception as e:
             logger.warning(f"Failed to save diagnostic data: {e}")
 
 
-async def load_config() -> Dict[str, Any]:
+def _setup_logging() -> None:
+    """Configure root logging for command-line runs (not on import)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+
+def load_config() -> Dict[str, Any]:
     """Load configuration from config.json"""
-    config_path = Path(__file__).parent / "config.json"
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    config = json_utils.loads(_CONFIG_PATH.read_bytes())
 
     # Validate required fields
     if "portal" not in config:
@@ -1605,7 +2260,7 @@ async def load_config() -> Dict[str, Any]:
             )
 
     # Ensure output folder exists
-    output_folder = Path(__file__).parent / config.get("output_folder", "output")
+    output_folder = _CONFIG_PATH.parent / config.get("output_folder", "output")
     output_folder.mkdir(exist_ok=True)
 
     return config
@@ -1614,7 +2269,7 @@ async def load_config() -> Dict[str, Any]:
 async def main():
     """Main entry point for the apartment scraper."""
     try:
-        config = await load_config()
+        config = load_config()
 
         if config["portal"] != "willhaben":
             logger.error(f"Unsupported portal: {config['portal']}")
@@ -1640,4 +2295,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    _setup_logging()
     asyncio.run(main())
@@ -1,13 +1,53 @@
 """Apartment listing data model."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from .constants import RENT_PER_SQM_DEFAULTS, TRANSACTION_COSTS, VIENNA_DISTRICTS
+from .constants import (
+    RENT_PER_SQM_DEFAULTS,
+    TRANSACTION_COSTS,
+    VIENNA_DISTRICT_MULTIPLIERS,
+)
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _field_order(cls: type) -> Tuple[str, ...]:
+    """Names of a dataclass's fields in declaration order, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """Names of a dataclass's fields, computed once per class."""
+    return frozenset(_field_order(cls))
+
+
+@lru_cache(maxsize=32)
+def _monthly_payment_factor(mortgage_rate: float, loan_term_years: int) -> float:
+    """
+    Monthly mortgage payment per unit of loan (annuity factor).
+
+    Depends only on the loan terms, which are the same for every listing of
+    a run, so the exponentiation is done once per distinct rate/term.
+
+    Args:
+        mortgage_rate: Annual interest rate as percentage
+        loan_term_years: Loan term in years
+
+    Returns:
+        Monthly payment divided by loan amount
+    """
+    num_payments = loan_term_years * 12
+    if mortgage_rate > 0:
+        monthly_rate = mortgage_rate / 100 / 12
+        growth = (1 + monthly_rate) ** num_payments
+        return monthly_rate * growth / (growth - 1)
+    return 1 / num_payments
+
+
+@dataclass(slots=True)
 class ApartmentListing:
     """Comprehensive data model for Austrian apartment listings."""
 
@@ -178,18 +218,19 @@ class ApartmentListing:
         if not self.size_sqm:
             return None
 
-        # Determine base rent per sqm
+        # Determine base rent per sqm (city lowered once for both lookups)
+        city = self.city.lower() if self.city else None
         if rent_per_sqm:
             base_rent = rent_per_sqm
-        elif self.city and self.city.lower() == "wien":
+        elif city == "wien":
             # Vienna: use inner/outer distinction
             if self.district_number and self.district_number <= 9:
                 base_rent = RENT_PER_SQM_DEFAULTS["vienna_inner"]
             else:
                 base_rent = RENT_PER_SQM_DEFAULTS["vienna_outer"]
-        elif self.city:
+        elif city:
             # Try to find city-specific rate
-            city_key = self.city.lower().replace(" ", "_")
+            city_key = city.replace(" ", "_")
             base_rent = RENT_PER_SQM_DEFAULTS.get(
                 city_key, RENT_PER_SQM_DEFAULTS["default"]
             )
@@ -197,8 +238,8 @@ class ApartmentListing:
             base_rent = RENT_PER_SQM_DEFAULTS["default"]
 
         # Apply Vienna district multiplier if applicable
-        if self.district_number and self.district_number in VIENNA_DISTRICTS:
-            multiplier = VIENNA_DISTRICTS[self.district_number]["multiplier"]
+        multiplier = VIENNA_DISTRICT_MULTIPLIERS.get(self.district_number)
+        if multiplier is not None:
             base_rent *= multiplier
 
         self.estimated_rent = round(base_rent * self.size_sqm, 2)
@@ -225,16 +266,9 @@ class ApartmentListing:
         loan_amount = self.price * (1 - down_payment_percent / 100)
 
         # Monthly mortgage payment (annuity formula)
-        if mortgage_rate > 0:
-            monthly_rate = mortgage_rate / 100 / 12
-            num_payments = loan_term_years * 12
-            mortgage_payment = (
-                loan_amount
-                * (monthly_rate * (1 + monthly_rate) ** num_payments)
-                / ((1 + monthly_rate) ** num_payments - 1)
-            )
-        else:
-            mortgage_payment = loan_amount / (loan_term_years * 12)
+        mortgage_payment = loan_amount * _monthly_payment_factor(
+            mortgage_rate, loan_term_years
+        )
 
         # Monthly costs
         operating_costs = self.betriebskosten_monthly or 0
@@ -246,17 +280,13 @@ class ApartmentListing:
         return self.cash_flow_monthly
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if value is not None:
-                if isinstance(value, datetime):
-                    result[key] = value.isoformat()
-                elif isinstance(value, list):
-                    result[key] = value if value else None
-                else:
-                    result[key] = value
-        return {k: v for k, v in result.items() if v is not None}
+        """Convert to dictionary for serialization (None and empty lists omitted)."""
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key in _field_order(type(self))
+            if (value := getattr(self, key)) is not None
+            and not (isinstance(value, list) and not value)
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ApartmentListing":
@@ -266,7 +296,7 @@ class ApartmentListing:
             data["scraped_at"] = datetime.fromisoformat(data["scraped_at"])
 
         # Filter to only valid fields
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = _field_names(cls)
         filtered_data = {k: v for k, v in data.items() if k in valid_fields}
 
         return cls(**filtered_data)
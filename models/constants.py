@@ -93,6 +93,11 @@ VIENNA_DISTRICTS: Dict[int, Dict[str, any]] = {
     23: {"name": "Liesing", "multiplier": 0.90},
 }
 
+# Flat district -> rent multiplier view for the per-listing rent estimate
+VIENNA_DISTRICT_MULTIPLIERS: Dict[int, float] = {
+    number: info["multiplier"] for number, info in VIENNA_DISTRICTS.items()
+}
+
 # Default rent per sqm by city/region (EUR)
 RENT_PER_SQM_DEFAULTS: Dict[str, float] = {
     "default": 12.0,
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ApartmentMetadata:
     """
     Lightweight metadata for summary generation and top-N tracking.
@@ -216,5 +216,39 @@ class TestValidationMinimums:
         # However, our new patterns won't match single digits, so this is already handled
 
 
+class TestKeywordGates:
+    """Test that keyword probes never hide a regex match."""
+
+    def test_every_match_contains_a_keyword(self):
+        """Each gated pattern's matches contain one of its keywords."""
+        extractor = AustrianRealEstateExtractor()
+        text = (
+            "Aufzug, LIFT, Fahrstuhl, Balkon, Terrasse, Loggia, Garten, "
+            "Kellerabteil, Abstellraum, Lagerraum, Tiefgarage, Garage, "
+            "Stellplatz, Parkplatz, Carport, möbliert, eingerichtet, "
+            "barrierefrei, Fernwärme, Gasheizung, Zentralheizung, "
+            "Etagenheizung, Fußbodenheizung, Elektroheizung, Wärmepumpe, "
+            "Erstbezug, Erstbezug nach Sanierung, frisch saniert, renoviert, "
+            "renovierungsbedürftig, neuwertig, sehr guter Zustand, gepflegt, "
+            "Altbau, Neubau, Gründerzeit"
+        )
+        for pattern, keywords in extractor.PATTERN_KEYWORDS.items():
+            matches = [m.group(0).lower() for m in pattern.finditer(text)]
+            assert matches, pattern.pattern
+            for match in matches:
+                assert any(keyword in match for keyword in keywords), (pattern.pattern, match)
+
+    def test_gated_extraction_matches_ungated(self):
+        """Passing the lowered text does not change extract_boolean results."""
+        extractor = AustrianRealEstateExtractor()
+        html = "<p>Helle Wohnung mit BALKON und Tiefgarage, provisionsfrei</p>"
+        lowered = html.lower()
+        for pattern in extractor.PATTERN_KEYWORDS:
+            assert extractor.extract_boolean(html, pattern, lowered) == extractor.extract_boolean(
+                html, pattern
+            )
+        assert extractor.extract_from_html(html)["commission_free"] is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+"""Unit tests for JSON-LD parsing in the scraper."""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from main import EnhancedApartmentScraper
+
+PRODUCT_BLOCK = (
+    '<script type="application/ld+json">'
+    '{"@context":"https://schema.org","@type":"Product","name":"Wohnung",'
+    '"offers":{"@type":"Offer","price":"180000"}}'
+    "</script>"
+)
+ITEMLIST_BLOCK = (
+    '<script type="application/ld+json">'
+    '{"@context":"https://schema.org","@type":"ItemList","itemListElement":['
+    '{"@type":"ListItem","position":1,"url":"/iad/immobilien/d/wohnung/111/"},'
+    '{"@type":"ListItem","position":2,"url":"/iad/immobilien/d/wohnung/222/"}]}'
+    "</script>"
+)
+BREADCRUMB_BLOCK = (
+    '<script type="application/ld+json">'
+    '{"@context":"https://schema.org","@type":"BreadcrumbList","itemListElement":[]}'
+    "</script>"
+)
+
+
+class TestJsonLdParsing:
+    """Test single-pass JSON-LD block parsing."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create scraper instance for testing."""
+        config = {
+            "portal": "willhaben",
+            "postal_codes": ["1010"],
+            "output_folder": str(tmp_path),
+        }
+        return EnhancedApartmentScraper(config)
+
+    def test_blocks_keyed_by_type(self, scraper):
+        """Each JSON-LD block is available under its @type."""
+        html = f"<html><head>{BREADCRUMB_BLOCK}{PRODUCT_BLOCK}</head></html>"
+        blocks = scraper._parse_json_ld_blocks(html)
+        assert set(blocks) == {"BreadcrumbList", "Product"}
+        assert blocks["Product"]["offers"]["price"] == "180000"
+
+    def test_malformed_block_skipped(self, scraper):
+        """Invalid JSON in one block does not hide the others."""
+        broken = '<script type="application/ld+json">{"@type": "Product",</script>'
+        html = f"{broken}{PRODUCT_BLOCK}"
+        assert scraper._extract_json_ld(html)["name"] == "Wohnung"
+
+    def test_no_product(self, scraper):
+        """Pages without a Product block yield None."""
+        assert scraper._extract_json_ld(f"<html>{BREADCRUMB_BLOCK}</html>") is None
+
+    def test_extract_listing_urls(self, scraper):
+        """ItemList entries are turned into absolute willhaben URLs."""
+        urls = scraper.extract_listing_urls(f"<html>{BREADCRUMB_BLOCK}{ITEMLIST_BLOCK}</html>")
+        assert urls == [
+            {"url": "https://www.willhaben.at/iad/immobilien/d/wohnung/111/"},
+            {"url": "https://www.willhaben.at/iad/immobilien/d/wohnung/222/"},
+        ]
+
+    def test_extract_listing_urls_absolute_and_malformed(self, scraper):
+        """Absolute URLs are kept as-is and non-path entries are dropped."""
+        items = (
+            '{"@type":"ListItem","position":1,"url":"https://www.willhaben.at/iad/x/333/"},'
+            '{"@type":"ListItem","position":2,"url":"javascript:void(0)"}'
+        )
+        html = (
+            '<script type="application/ld+json">'
+            f'{{"@type":"ItemList","itemListElement":[{items}]}}'
+            "</script>"
+        )
+        assert scraper.extract_listing_urls(html) == [
+            {"url": "https://www.willhaben.at/iad/x/333/"}
+        ]
+
+    def test_type_filter_skips_other_blocks(self, scraper):
+        """Blocks of unrequested types are not decoded."""
+        html = f"{BREADCRUMB_BLOCK}{ITEMLIST_BLOCK}{PRODUCT_BLOCK}"
+        blocks = scraper._parse_json_ld_blocks(html, {"Product"})
+        assert list(blocks) == ["Product"]
+
+    def test_non_object_block_skipped(self, scraper):
+        """Blocks that are not JSON objects are skipped without decoding."""
+        script = '<script type="application/ld+json">\n  var x = 1;</script>'
+        array = '<script type="application/ld+json"> [{"@type": "Product"}]</script>'
+        html = f"{script}{array}{PRODUCT_BLOCK}"
+        assert list(scraper._parse_json_ld_blocks(html)) == ["Product"]
+
+    def test_nested_type_before_top_level_type(self, scraper):
+        """A nested @type ahead of the top-level one does not hide the block."""
+        product = (
+            '<script type="application/ld+json">'
+            '{"brand":{"@type":"Brand","name":"X"},"offers":{"@type":"Offer","price":"99000"},'
+            '"@type":"Product","name":"Wohnung"}'
+            "</script>"
+        )
+        html = f"{BREADCRUMB_BLOCK}{product}"
+        assert scraper._extract_json_ld(html)["offers"]["price"] == "99000"
+
+    def test_unterminated_block_ignored(self, scraper):
+        """A script tag without a closing tag ends the scan cleanly."""
+        html = f'{PRODUCT_BLOCK}<script type="application/ld+json">{{"@type": "ItemList"'
+        assert list(scraper._parse_json_ld_blocks(html)) == ["Product"]
@@ -0,0 +1,75 @@
+"""Unit tests for the cross-run LLM extraction cache."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from main import _STAR_ICON_PATH, EnhancedApartmentScraper
+
+LISTING_URL = "https://www.willhaben.at/iad/immobilien/d/wohnung/123456/"
+LISTING_HTML = f'<html><body><svg><path d="{_STAR_ICON_PATH}"/></svg></body></html>'
+
+
+class StubExtractor:
+    """Stand-in for OllamaExtractor returning a fixed result."""
+
+    model = "stub-model"
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def extract_structured_data(self, html_content, existing_data=None):
+        self.calls.append(existing_data)
+        return self.result
+
+
+class TestLlmCache:
+    """Test which LLM results end up in the cache."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create a scraper with LLM extraction and caching enabled."""
+        config = {
+            "portal": "willhaben",
+            "postal_codes": ["1010"],
+            "output_folder": str(tmp_path),
+            "llm_settings": {
+                "enabled": True,
+                "cache_results": True,
+                "trigger_mode": "always",
+            },
+        }
+        scraper = EnhancedApartmentScraper(config)
+        yield scraper
+        scraper._llm_cache.close()
+
+    def test_failed_extraction_not_cached(self, scraper):
+        """A failed extraction with empty existing data is not cached."""
+        scraper.llm_extractor = StubExtractor(None)
+        asyncio.run(scraper.extract_apartment_data(LISTING_HTML, LISTING_URL))
+        assert scraper.llm_extractor.calls == [{}]
+        assert len(scraper._llm_cache) == 0
+
+    def test_successful_extraction_cached(self, scraper):
+        """A successful extraction is cached and reused for the same listing."""
+        scraper.llm_extractor = StubExtractor({"rooms": 3.0})
+        apartment = asyncio.run(scraper.extract_apartment_data(LISTING_HTML, LISTING_URL))
+        assert apartment.rooms == 3.0
+        assert len(scraper._llm_cache) == 1
+
+        asyncio.run(scraper.extract_apartment_data(LISTING_HTML, LISTING_URL))
+        assert len(scraper.llm_extractor.calls) == 1
+
+    def test_cache_key_ignores_page_html_when_json_ld_present(self, scraper):
+        """Two renders of the same listing share a key when JSON-LD matches."""
+        scraper.llm_extractor = StubExtractor(None)
+        json_ld = {"@type": "Product", "name": "Wohnung"}
+        first = scraper._llm_cache_key("123456", json_ld, {}, "<html>render 1</html>")
+        second = scraper._llm_cache_key("123456", json_ld, {}, "<html>render 2</html>")
+        assert first == second
+        assert first.startswith("stub-model:123456:")
@@ -0,0 +1,78 @@
+"""Unit tests for the max_apartments cap under concurrent processing."""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from main import EnhancedApartmentScraper
+from models.apartment import ApartmentListing
+
+
+class TestMaxApartments:
+    """Test that concurrent listings respect max_apartments."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create a scraper whose fetch, extraction and write steps are stubbed."""
+        config = {
+            "portal": "willhaben",
+            "postal_codes": ["1010"],
+            "output_folder": str(tmp_path),
+            "max_apartments": 1,
+            "rate_limiting": {"max_concurrent_apartments": 8},
+        }
+        scraper = EnhancedApartmentScraper(config)
+
+        async def crawl(crawler, url, config):
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(success=True, html="<html></html>")
+
+        async def extract(html, url):
+            return ApartmentListing(
+                listing_id=scraper.extract_listing_id(url),
+                source_url=url,
+                price=150000.0,
+                size_sqm=50.0,
+                rooms=2.0,
+            )
+
+        scraper._crawl = crawl
+        scraper.extract_apartment_data = extract
+        scraper._write_apartment_immediately = lambda apartment, **kwargs: str(
+            tmp_path / f"{apartment.listing_id}.md"
+        )
+        return scraper
+
+    def _run_page(self, scraper, count):
+        """Process `count` listings concurrently, as run() does for one page."""
+        urls = [f"https://www.willhaben.at/iad/immobilien/d/wohnung/{1000 + i}/" for i in range(count)]
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    scraper._process_listing(None, url, scraper._claim_listing(url), i + 1, count)
+                    for i, url in enumerate(urls)
+                )
+            )
+
+        return asyncio.run(run())
+
+    def test_cap_not_overshot(self, scraper):
+        """Only max_apartments listings are processed when more run concurrently."""
+        results = self._run_page(scraper, 8)
+        assert len(scraper.apartment_metadata) == 1
+        assert sum(1 for result in results if result) == 1
+        assert scraper._apartments_in_progress == 0
+
+    def test_failed_listing_releases_slot(self, scraper):
+        """A listing that is filtered out gives its slot back."""
+        scraper.filters["max_price"] = 100000
+        self._run_page(scraper, 3)
+        assert scraper.apartment_metadata == []
+        assert scraper._apartments_in_progress == 0
+        assert not scraper._reached_max_apartments()
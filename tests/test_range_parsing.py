@@ -142,6 +142,21 @@ class TestRangeParsingIntegration:
         assert extracted["price"] == 120000.0  # Single value
         assert extracted["betriebskosten_monthly"] == 100.0  # Range - lower bound
 
+    def test_extract_skips_known_fields(self, extractor):
+        """Fields passed as skip_fields are not extracted again."""
+        html = """
+        <div>Wohnfläche: 65 m²</div>
+        <div>3 Zimmer</div>
+        <div>Kaufpreis: €120.000</div>
+        <div>Betriebskosten: €150 monatlich</div>
+        """
+        extracted = extractor.extract_from_html(html, skip_fields={"price", "size_sqm"})
+
+        assert "price" not in extracted
+        assert "size_sqm" not in extracted
+        assert extracted["rooms"] == 3.0
+        assert extracted["betriebskosten_monthly"] == 150.0
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
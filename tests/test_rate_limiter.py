@@ -0,0 +1,140 @@
+"""Unit tests for the token bucket rate limiter."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.rate_limiter import TokenBucketLimiter, parse_retry_after
+
+
+class TestTokenBucketLimiter:
+    """Test token bucket pacing and throttling."""
+
+    def test_burst_does_not_wait(self):
+        """Requests within the burst size are issued immediately."""
+        limiter = TokenBucketLimiter(rate=1.0, burst=3)
+
+        async def run():
+            start = time.monotonic()
+            for _ in range(3):
+                await limiter.acquire()
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 0.1
+
+    def test_waits_when_bucket_empty(self):
+        """Requests beyond the burst are paced at the configured rate."""
+        limiter = TokenBucketLimiter(rate=20.0, burst=1)
+
+        async def run():
+            start = time.monotonic()
+            for _ in range(3):
+                await limiter.acquire()
+            return time.monotonic() - start
+
+        # Two waits of ~50ms each
+        assert asyncio.run(run()) >= 0.09
+
+    def test_slow_down_halves_rate(self):
+        """Throttling halves the rate but never drops below min_rate."""
+        limiter = TokenBucketLimiter(rate=2.0, min_rate=0.5)
+        limiter.slow_down()
+        assert limiter.rate == 1.0
+        limiter.slow_down()
+        limiter.slow_down()
+        assert limiter.rate == 0.5
+
+    def test_retry_after_pauses_requests(self):
+        """A Retry-After header holds back the next request."""
+        limiter = TokenBucketLimiter(rate=100.0, burst=5)
+        assert limiter.update_from_headers({"Retry-After": "0.1"}) == 0.1
+
+        async def run():
+            start = time.monotonic()
+            await limiter.acquire()
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.09
+
+    def test_exhausted_rate_limit_headers(self):
+        """X-RateLimit-Reset is honored only once the remaining budget is zero."""
+        limiter = TokenBucketLimiter(rate=1.0)
+        assert limiter.update_from_headers({"x-ratelimit-remaining": "5", "x-ratelimit-reset": "30"}) is None
+        assert limiter.update_from_headers({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "30"}) == 30.0
+        assert limiter.update_from_headers({}) is None
+
+
+def test_parse_retry_after():
+    """Retry-After accepts delta-seconds and HTTP dates."""
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+class TestHttpFetchThrottling:
+    """Test that the plain HTTP fetch path reacts to HTTP 429."""
+
+    def test_429_slows_down_and_pauses_host(self, tmp_path):
+        """A 429 reduces the host's rate and honors Retry-After."""
+        import httpx
+        from main import EnhancedApartmentScraper
+
+        scraper = EnhancedApartmentScraper(
+            {"portal": "willhaben", "postal_codes": ["1010"], "output_folder": str(tmp_path)}
+        )
+        url = "https://www.willhaben.at/iad/immobilien/d/wohnung/123/"
+        limiter = scraper._get_rate_limiter(url)
+        rate_before = limiter.rate
+
+        async def run():
+            transport = httpx.MockTransport(
+                lambda request: httpx.Response(429, headers={"Retry-After": "5"})
+            )
+            async with httpx.AsyncClient(transport=transport) as client:
+                scraper._http_client = client
+                return await scraper._fetch_html_http(url)
+
+        assert asyncio.run(run()) is None
+        assert limiter.rate == rate_before * 0.5
+        assert limiter._paused_until - time.monotonic() > 4
+
+    def test_fast_detail_pages_keeps_search_pages_in_browser(self, tmp_path):
+        """With only fast_detail_pages set, search pages still use the crawler."""
+        import httpx
+        from types import SimpleNamespace
+        from main import EnhancedApartmentScraper
+
+        scraper = EnhancedApartmentScraper(
+            {
+                "portal": "willhaben",
+                "postal_codes": ["1010"],
+                "output_folder": str(tmp_path),
+                "fast_detail_pages": True,
+            }
+        )
+        http_requests = []
+        crawl_configs = []
+
+        async def crawl(crawler, url, config):
+            crawl_configs.append(config)
+            return SimpleNamespace(success=True, html="<html></html>")
+
+        scraper._crawl = crawl
+
+        def handler(request):
+            http_requests.append(request)
+            return httpx.Response(200, text="<html></html>")
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                scraper._http_client = client
+                return await scraper.fetch_listing_page(None, 1)
+
+        assert asyncio.run(run()) == []
+        assert http_requests == []
+        assert crawl_configs == [scraper._search_run_config]
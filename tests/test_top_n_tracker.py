@@ -0,0 +1,51 @@
+"""Unit tests for top-N apartment tracking."""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.apartment import ApartmentListing
+from utils.top_n_tracker import TopNTracker
+
+
+def make_apartment(listing_id: str, score):
+    """Create a minimal apartment with the given investment score."""
+    apartment = ApartmentListing(
+        listing_id=listing_id, source_url=f"https://example.com/{listing_id}", source_portal="willhaben"
+    )
+    apartment.investment_score = score
+    return apartment
+
+
+class TestTopNTracker:
+    """Test that the tracker keeps the N best apartments."""
+
+    def test_keeps_highest_scores(self):
+        """Worse apartments are evicted once the tracker is full."""
+        tracker = TopNTracker(3)
+        for i, score in enumerate([5.0, 9.0, 1.0, 7.0, 3.0, 8.0]):
+            tracker.add(make_apartment(str(i), score))
+
+        scores = [apt.investment_score for apt in tracker.get_sorted_apartments()]
+        assert scores == [9.0, 8.0, 7.0]
+        assert tracker.min_score() == 7.0
+
+    def test_rejects_worse_when_full(self):
+        """An apartment below the current minimum is not added."""
+        tracker = TopNTracker(2)
+        tracker.add(make_apartment("a", 6.0))
+        tracker.add(make_apartment("b", 4.0))
+        assert tracker.add(make_apartment("c", 3.0)) is False
+        assert tracker.add(make_apartment("d", 5.0)) is True
+        assert [apt.listing_id for apt in tracker.get_sorted_apartments()] == ["a", "d"]
+
+    def test_equal_scores(self):
+        """Ties (including missing scores) never compare apartments directly."""
+        tracker = TopNTracker(3)
+        for listing_id in ["a", "b", "c", "d"]:
+            tracker.add(make_apartment(listing_id, None))
+
+        assert len(tracker) == 3
+        assert [apt.listing_id for apt in tracker.get_sorted_apartments()] == ["a", "b", "c"]
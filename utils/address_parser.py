@@ -1,10 +1,43 @@
 """Austrian address parsing utilities."""
 
 import re
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from models.constants import AUSTRIAN_STATES, POSTAL_CODE_RANGES, VIENNA_DISTRICTS
 
+# (district number, lowercased name) pairs for the name lookup, lowered once
+_VIENNA_DISTRICT_NAMES: Tuple[Tuple[int, str], ...] = tuple(
+    (district_num, info["name"].lower()) for district_num, info in VIENNA_DISTRICTS.items()
+)
+
+
+@lru_cache(maxsize=None)
+def _vienna_district_for_postal(postal_code: str) -> Optional[int]:
+    """Vienna district for a postal code (memoized, the set of codes is small)."""
+    try:
+        code = int(postal_code)
+        if 1010 <= code <= 1239:
+            district = (code % 1000) // 10
+            if 1 <= district <= 23:
+                return district
+    except ValueError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=None)
+def _state_for_postal(postal_code: str) -> Optional[str]:
+    """Austrian state for a postal code (memoized, avoids rescanning the ranges)."""
+    try:
+        code = int(postal_code)
+        for state, (start, end) in POSTAL_CODE_RANGES.items():
+            if start <= code <= end:
+                return state
+    except ValueError:
+        pass
+    return None
+
 
 class AustrianAddressParser:
     """Parser for Austrian address formats."""
@@ -43,6 +76,10 @@ class AustrianAddressParser:
         r"^(?P<city>[A-Za-zäöüÄÖÜß\s\-]+?)(?:\s*,\s*(?P<state>[A-Za-zäöüÄÖÜß\s\-]+))?$"
     )
 
+    # Vienna postal code or "X. Bezirk" inside free text
+    VIENNA_POSTAL_PATTERN = re.compile(r"\b(1\d{3})\b")
+    BEZIRK_PATTERN = re.compile(r"(\d{1,2})\.\s*Bezirk", re.IGNORECASE)
+
     # Vienna-specific street suffixes
     STREET_SUFFIXES = [
         "straße",
@@ -143,26 +180,11 @@ class AustrianAddressParser:
         Vienna postal codes: 1XXX where XX is the district (01-23).
         Example: 1030 -> district 3, 1220 -> district 22
         """
-        try:
-            code = int(postal_code)
-            if 1010 <= code <= 1239:
-                district = (code % 1000) // 10
-                if 1 <= district <= 23:
-                    return district
-        except ValueError:
-            pass
-        return None
+        return _vienna_district_for_postal(postal_code)
 
     def _get_state_from_postal(self, postal_code: str) -> Optional[str]:
         """Determine Austrian state from postal code."""
-        try:
-            code = int(postal_code)
-            for state, (start, end) in POSTAL_CODE_RANGES.items():
-                if start <= code <= end:
-                    return state
-        except ValueError:
-            pass
-        return None
+        return _state_for_postal(postal_code)
 
     def format_address(
         self,
@@ -204,14 +226,14 @@ class AustrianAddressParser:
             return None
 
         # Try postal code first
-        postal_match = re.search(r"\b(1\d{3})\b", text)
+        postal_match = self.VIENNA_POSTAL_PATTERN.search(text)
         if postal_match:
             district = self._parse_vienna_district(postal_match.group(1))
             if district:
                 return district
 
         # Try "X. Bezirk" pattern
-        bezirk_match = re.search(r"(\d{1,2})\.\s*Bezirk", text, re.IGNORECASE)
+        bezirk_match = self.BEZIRK_PATTERN.search(text)
         if bezirk_match:
             district = int(bezirk_match.group(1))
             if 1 <= district <= 23:
@@ -219,8 +241,8 @@ class AustrianAddressParser:
 
         # Try district name lookup
         text_lower = text.lower()
-        for district_num, info in VIENNA_DISTRICTS.items():
-            if info["name"].lower() in text_lower:
+        for district_num, name in _VIENNA_DISTRICT_NAMES:
+            if name in text_lower:
                 return district_num
 
         return None
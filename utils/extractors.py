@@ -2,12 +2,25 @@
 
 import logging
 import re
-from typing import Any, Dict, List, Optional, Pattern
+from typing import Any, Collection, Dict, FrozenSet, List, Optional, Pattern, Tuple
 
 from models.constants import VIENNA_DISTRICTS
 
 logger = logging.getLogger(__name__)
 
+# BeautifulSoup tree builder: lxml's C parser when installed (pulled in by
+# crawl4ai), otherwise the pure-Python stdlib parser
+try:
+    import lxml  # noqa: F401
+
+    _BS4_PARSER = "lxml"
+except ImportError:
+    _BS4_PARSER = "html.parser"
+
+# German number format in one pass: drop spaces and thousands dots, and turn
+# the decimal comma into a dot
+_GERMAN_NUMBER_TABLE = str.maketrans({" ": None, ".": None, ",": "."})
+
 
 class AustrianRealEstateExtractor:
     """Extractor for Austrian real estate listings using regex patterns."""
@@ -96,6 +109,26 @@ class AustrianRealEstateExtractor:
         "mezzanin": 1,
     }
 
+    # Special floor terms shown as upper-case abbreviations
+    FLOOR_ABBREVIATIONS: FrozenSet[str] = frozenset({"eg", "dg", "ug", "hp"})
+
+    # DOM labels that mark operating costs
+    BETRIEBSKOSTEN_LABEL_KEYWORDS: Tuple[str, ...] = ("betriebskosten", "nebenkosten", "bk", "nk")
+
+    # Attic floor (Dachgeschoss) without a floor number
+    ATTIC_PATTERN: Pattern = re.compile(r"(?:DG|Dachgeschoss|Dachgeschoß)", re.IGNORECASE)
+
+    # Leading numeric part of a DOM value cell (allows dashes for ranges)
+    DOM_NUMBER_PATTERN: Pattern = re.compile(r"([\d.,\s-]+)")
+
+    # Range separators (in order of specificity)
+    RANGE_PATTERNS: List[Pattern] = [
+        re.compile(r"(\d+[.,\s]*\d*)\s*-\s*(\d+[.,\s]*\d*)", re.IGNORECASE),  # "40-140" or "40 - 140"
+        re.compile(r"(\d+[.,\s]*\d*)\s+bis\s+(\d+[.,\s]*\d*)", re.IGNORECASE),  # "40 bis 140"
+        re.compile(r"(\d+[.,\s]*\d*)\s*~\s*(\d+[.,\s]*\d*)", re.IGNORECASE),  # "40~140"
+        re.compile(r"(\d+[.,\s]*\d*)\s+to\s+(\d+[.,\s]*\d*)", re.IGNORECASE),  # "40 to 140"
+    ]
+
     # Year built patterns
     YEAR_PATTERNS: List[Pattern] = [
         re.compile(r"Baujahr[:\s]*(\d{4})", re.IGNORECASE),
@@ -172,6 +205,45 @@ class AustrianRealEstateExtractor:
         "parkplatz": re.compile(r"Parkplatz", re.IGNORECASE),
     }
 
+    # Lowercase literals, one of which every match of the pattern contains.
+    # extract_from_html probes the lowered page with ``in`` before running
+    # these IGNORECASE regexes, most of which miss on any given listing
+    PATTERN_KEYWORDS: Dict[Pattern, Tuple[str, ...]] = {
+        CONDITION_PATTERNS["erstbezug"]: ("erstbezug",),
+        CONDITION_PATTERNS["erstbezug_nach_sanierung"]: ("erstbezug",),
+        CONDITION_PATTERNS["saniert"]: ("saniert", "renoviert"),
+        CONDITION_PATTERNS["renovierungsbedurftig"]: ("bedürftig",),
+        CONDITION_PATTERNS["neuwertig"]: ("neuwertig",),
+        CONDITION_PATTERNS["sehr_gut"]: ("sehr",),
+        CONDITION_PATTERNS["gut"]: ("zustand",),
+        CONDITION_PATTERNS["gepflegt"]: ("gepflegt",),
+        BUILDING_TYPE_PATTERNS["altbau"]: ("altbau",),
+        BUILDING_TYPE_PATTERNS["neubau"]: ("neubau",),
+        BUILDING_TYPE_PATTERNS["grunderzeit"]: ("gründerzeit",),
+        HEATING_PATTERNS["fernwarme"]: ("fernwärme",),
+        HEATING_PATTERNS["gas"]: ("gas",),
+        HEATING_PATTERNS["zentralheizung"]: ("zentralheizung",),
+        HEATING_PATTERNS["etagenheizung"]: ("etagenheizung",),
+        HEATING_PATTERNS["fussbodenheizung"]: ("fußbodenheizung",),
+        HEATING_PATTERNS["elektro"]: ("elektro",),
+        HEATING_PATTERNS["warmepumpe"]: ("wärmepumpe",),
+        FEATURE_PATTERNS["elevator"]: ("aufzug", "lift", "fahrstuhl"),
+        FEATURE_PATTERNS["balcony"]: ("balkon",),
+        FEATURE_PATTERNS["terrace"]: ("terrasse",),
+        FEATURE_PATTERNS["loggia"]: ("loggia",),
+        FEATURE_PATTERNS["garden"]: ("garten",),
+        FEATURE_PATTERNS["cellar"]: ("keller",),
+        FEATURE_PATTERNS["storage"]: ("abstellraum", "lagerraum"),
+        FEATURE_PATTERNS["parking"]: ("garage", "stellplatz", "parkplatz", "carport"),
+        FEATURE_PATTERNS["furnished"]: ("möbliert", "eingerichtet"),
+        FEATURE_PATTERNS["barrier_free"]: ("barrierefrei",),
+        PARKING_TYPE_PATTERNS["tiefgarage"]: ("tiefgarage",),
+        PARKING_TYPE_PATTERNS["garage"]: ("garage",),
+        PARKING_TYPE_PATTERNS["stellplatz"]: ("stellplatz",),
+        PARKING_TYPE_PATTERNS["carport"]: ("carport",),
+        PARKING_TYPE_PATTERNS["parkplatz"]: ("parkplatz",),
+    }
+
     # Commission patterns
     COMMISSION_PATTERNS: List[Pattern] = [
         re.compile(r"provision(?:s)?frei", re.IGNORECASE),
@@ -179,6 +251,12 @@ class AustrianRealEstateExtractor:
         re.compile(r"(?:Makler)?provision[:\s]*([\d.,]+)\s*%", re.IGNORECASE),
     ]
 
+    # Commission checks used by extract_from_html. The "free" patterns stay
+    # separate: an alternation of them is slower in CPython's re because it
+    # loses the literal-prefix scan each pattern gets on its own
+    COMMISSION_FREE_PATTERNS: List[Pattern] = COMMISSION_PATTERNS[:2]
+    COMMISSION_PERCENT_PATTERN: Pattern = COMMISSION_PATTERNS[2]
+
     def __init__(self):
         """Initialize the extractor."""
         pass
@@ -232,8 +310,25 @@ class AustrianRealEstateExtractor:
                 return value_str
         return None
 
-    def extract_boolean(self, text: str, pattern: Pattern) -> bool:
-        """Check if pattern exists in text."""
+    def extract_boolean(
+        self, text: str, pattern: Pattern, lowered: Optional[str] = None
+    ) -> bool:
+        """Check if pattern exists in text.
+
+        Args:
+            text: Text to search
+            pattern: Regex pattern to look for
+            lowered: ``text.lower()``, if the caller has it; patterns listed
+                in PATTERN_KEYWORDS are then only run when one of their
+                keywords occurs in it
+
+        Returns:
+            True if the pattern matches anywhere in text
+        """
+        if lowered is not None:
+            keywords = self.PATTERN_KEYWORDS.get(pattern)
+            if keywords and not any(keyword in lowered for keyword in keywords):
+                return False
         return bool(pattern.search(text))
 
     def parse_number(self, value: str) -> Optional[float]:
@@ -250,12 +345,9 @@ class AustrianRealEstateExtractor:
         """
         if not value:
             return None
-        # Handle German number format:
-        # 1. Remove spaces
-        # 2. Replace comma (decimal separator) with placeholder
-        # 3. Remove all dots (thousands separators)
-        # 4. Replace placeholder with dot
-        cleaned = value.strip().replace(" ", "").replace(",", "###DECIMAL###").replace(".", "").replace("###DECIMAL###", ".")
+        # Handle German number format: remove spaces and dots (thousands
+        # separators), replace comma (decimal separator) with dot
+        cleaned = value.strip().translate(_GERMAN_NUMBER_TABLE)
         try:
             return float(cleaned)
         except ValueError:
@@ -291,16 +383,8 @@ class AustrianRealEstateExtractor:
         # Clean the string
         cleaned = value.strip()
 
-        # Range separators (in order of specificity)
-        range_patterns = [
-            r'(\d+[.,\s]*\d*)\s*-\s*(\d+[.,\s]*\d*)',      # "40-140" or "40 - 140"
-            r'(\d+[.,\s]*\d*)\s+bis\s+(\d+[.,\s]*\d*)',    # "40 bis 140"
-            r'(\d+[.,\s]*\d*)\s*~\s*(\d+[.,\s]*\d*)',      # "40~140"
-            r'(\d+[.,\s]*\d*)\s+to\s+(\d+[.,\s]*\d*)',     # "40 to 140"
-        ]
-
-        for pattern in range_patterns:
-            match = re.search(pattern, cleaned, re.IGNORECASE)
+        for pattern in self.RANGE_PATTERNS:
+            match = pattern.search(cleaned)
             if match:
                 lower_str = match.group(1)
                 upper_str = match.group(2)
@@ -349,22 +433,30 @@ class AustrianRealEstateExtractor:
             pass
         return None
 
-    def extract_floor(self, text: str) -> Dict[str, Any]:
-        """Extract floor information from text."""
+    def extract_floor(self, text: str, lowered: Optional[str] = None) -> Dict[str, Any]:
+        """Extract floor information from text.
+
+        Args:
+            text: Text to search
+            lowered: ``text.lower()``, if the caller already has it
+
+        Returns:
+            Dictionary with "floor" and "floor_text" (None when not found)
+        """
         result = {"floor": None, "floor_text": None}
 
         # Check special floor terms first
-        text_lower = text.lower()
+        text_lower = text.lower() if lowered is None else lowered
         for term, floor_num in self.FLOOR_SPECIAL.items():
             if term in text_lower:
                 result["floor"] = floor_num
                 result["floor_text"] = (
-                    term.upper() if term in ["eg", "dg", "ug", "hp"] else term.title()
+                    term.upper() if term in self.FLOOR_ABBREVIATIONS else term.title()
                 )
                 return result
 
         # Check for Dachgeschoss
-        if re.search(r"(?:DG|Dachgeschoss|Dachgeschoß)", text, re.IGNORECASE):
+        if self.ATTIC_PATTERN.search(text):
             result["floor_text"] = "DG"
             return result
 
@@ -391,7 +483,7 @@ class AustrianRealEstateExtractor:
             return {}
 
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _BS4_PARSER)
             extracted: Dict[str, Any] = {}
 
             # Find betriebskosten/nebenkosten in table rows or definition lists
@@ -405,9 +497,9 @@ class AustrianRealEstateExtractor:
                         value_text = cells[i + 1].get_text(strip=True)
 
                         # Look for betriebskosten/nebenkosten keywords
-                        if any(keyword in label_text for keyword in ['betriebskosten', 'nebenkosten', 'bk', 'nk']):
+                        if any(keyword in label_text for keyword in self.BETRIEBSKOSTEN_LABEL_KEYWORDS):
                             # Extract numeric value (allow dash for ranges)
-                            value_match = re.search(r'([\d.,\s-]+)', value_text)
+                            value_match = self.DOM_NUMBER_PATTERN.search(value_text)
                             if value_match:
                                 bk_value = self.parse_number_with_range(value_match.group(1))
                                 # Validate range (reject placeholders)
@@ -428,34 +520,47 @@ class AustrianRealEstateExtractor:
             logger.debug(f"DOM extraction failed: {e}")
             return {}
 
-    def extract_from_html(self, html: str) -> Dict[str, Any]:
+    def extract_from_html(
+        self, html: str, skip_fields: Collection[str] = ()
+    ) -> Dict[str, Any]:
         """
         Extract all available fields from HTML content.
 
+        Args:
+            html: Listing page HTML
+            skip_fields: Fields already known from structured data (only
+                "size_sqm", "rooms" and "price" are honored); their patterns
+                are not run over the page
+
         Returns a dictionary of extracted values.
         """
         extracted: Dict[str, Any] = {}
+        # Lowered once for the keyword probes below
+        lowered = html.lower()
 
         # Size - with range parsing and validation (10-500 m²)
-        size_str = self.extract_field(
-            html,
-            self.SIZE_PATTERNS,
-            parse_ranges=True,
-            min_value=10.0,   # Reject < 10 m² (extraction errors)
-            max_value=500.0   # Sanity check: reject mansions/commercial
-        )
-        if size_str:
-            extracted["size_sqm"] = self.parse_number_with_range(size_str)
+        if "size_sqm" not in skip_fields:
+            size_str = self.extract_field(
+                html,
+                self.SIZE_PATTERNS,
+                parse_ranges=True,
+                min_value=10.0,   # Reject < 10 m² (extraction errors)
+                max_value=500.0   # Sanity check: reject mansions/commercial
+            )
+            if size_str:
+                extracted["size_sqm"] = self.parse_number_with_range(size_str)
 
         # Rooms - with range parsing
-        rooms_str = self.extract_field(html, self.ROOM_PATTERNS, parse_ranges=True)
-        if rooms_str:
-            extracted["rooms"] = self.parse_number_with_range(rooms_str)
+        if "rooms" not in skip_fields:
+            rooms_str = self.extract_field(html, self.ROOM_PATTERNS, parse_ranges=True)
+            if rooms_str:
+                extracted["rooms"] = self.parse_number_with_range(rooms_str)
 
         # Price - with range parsing
-        price_str = self.extract_field(html, self.PRICE_PATTERNS, parse_ranges=True)
-        if price_str:
-            extracted["price"] = self.parse_number_with_range(price_str)
+        if "price" not in skip_fields:
+            price_str = self.extract_field(html, self.PRICE_PATTERNS, parse_ranges=True)
+            if price_str:
+                extracted["price"] = self.parse_number_with_range(price_str)
 
         # Betriebskosten / Nebenkosten - with range parsing
         # Use min_value to reject placeholder values like "€1"
@@ -475,7 +580,7 @@ class AustrianRealEstateExtractor:
             extracted["reparaturrucklage"] = self.parse_number_with_range(rep_str)
 
         # Floor
-        floor_info = self.extract_floor(html)
+        floor_info = self.extract_floor(html, lowered)
         if floor_info["floor"] is not None:
             extracted["floor"] = floor_info["floor"]
         if floor_info["floor_text"]:
@@ -493,13 +598,13 @@ class AustrianRealEstateExtractor:
 
         # Condition
         for condition_key, pattern in self.CONDITION_PATTERNS.items():
-            if self.extract_boolean(html, pattern):
+            if self.extract_boolean(html, pattern, lowered):
                 extracted["condition"] = condition_key
                 break
 
         # Building type
         for building_key, pattern in self.BUILDING_TYPE_PATTERNS.items():
-            if self.extract_boolean(html, pattern):
+            if self.extract_boolean(html, pattern, lowered):
                 extracted["building_type"] = building_key
                 break
 
@@ -520,34 +625,31 @@ class AustrianRealEstateExtractor:
 
         # Heating type
         for heating_key, pattern in self.HEATING_PATTERNS.items():
-            if self.extract_boolean(html, pattern):
+            if self.extract_boolean(html, pattern, lowered):
                 extracted["heating_type"] = heating_key
                 break
 
         # Boolean features
         for feature_key, pattern in self.FEATURE_PATTERNS.items():
-            if self.extract_boolean(html, pattern):
+            if self.extract_boolean(html, pattern, lowered):
                 extracted[feature_key] = True
 
         # Parking type (more specific than boolean)
         for parking_key, pattern in self.PARKING_TYPE_PATTERNS.items():
-            if self.extract_boolean(html, pattern):
+            if self.extract_boolean(html, pattern, lowered):
                 extracted["parking"] = parking_key
                 break
 
-        # Commission
-        if re.search(
-            r"provision(?:s)?frei|keine\s+(?:Makler)?provision", html, re.IGNORECASE
-        ):
-            extracted["commission_free"] = True
-        else:
-            commission_match = re.search(
-                r"(?:Makler)?provision[:\s]*([\d.,]+)\s*%", html, re.IGNORECASE
-            )
-            if commission_match:
-                extracted["commission_free"] = False
-                extracted["commission_percent"] = self.parse_number(
-                    commission_match.group(1)
-                )
+        # Commission (every commission pattern contains "provision")
+        if "provision" in lowered:
+            if any(pattern.search(html) for pattern in self.COMMISSION_FREE_PATTERNS):
+                extracted["commission_free"] = True
+            else:
+                commission_match = self.COMMISSION_PERCENT_PATTERN.search(html)
+                if commission_match:
+                    extracted["commission_free"] = False
+                    extracted["commission_percent"] = self.parse_number(
+                        commission_match.group(1)
+                    )
 
         return extracted
@@ -0,0 +1,56 @@
+"""JSON encoding and decoding with optional orjson acceleration."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, stdlib json is the fallback
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Stdlib json also accepts NaN/Infinity and arbitrarily large ints,
+            # and raises the error callers expect for truly invalid input
+            pass
+    return json.loads(data)
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    Encode an object as indented UTF-8 JSON, using orjson when it is installed.
+
+    Non-ASCII text is kept as-is. Values JSON cannot represent are written
+    via str() (orjson encodes datetimes natively as ISO 8601 instead).
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        UTF-8 encoded JSON with two-space indentation
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits; stdlib json handles those
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
@@ -25,6 +25,14 @@ from utils.translations import (
 class MarkdownGenerator:
     """Generator for individual apartment markdown files with YAML frontmatter."""
 
+    # Filename sanitizing: drop punctuation, collapse whitespace to underscores
+    _UNSAFE_CHARS_RE = re.compile(r"[^\w\s-]")
+    _WHITESPACE_RE = re.compile(r"[\s]+")
+    # Umlaut transliteration, applied in one pass with str.translate
+    _UMLAUT_TABLE = str.maketrans(
+        {"ä": "ae", "ö": "oe", "ü": "ue", "Ä": "Ae", "Ö": "Oe", "Ü": "Ue", "ß": "ss"}
+    )
+
     def __init__(self, output_dir: str = "output/apartments"):
         """
         Initialize the generator.
@@ -80,21 +88,11 @@ class MarkdownGenerator:
     def _sanitize_filename(self, text: str) -> str:
         """Sanitize text for use in filename."""
         # Remove umlauts
-        replacements = {
-            "ä": "ae",
-            "ö": "oe",
-            "ü": "ue",
-            "Ä": "Ae",
-            "Ö": "Oe",
-            "Ü": "Ue",
-            "ß": "ss",
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        text = text.translate(self._UMLAUT_TABLE)
 
         # Keep only alphanumeric and convert spaces to underscores
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[\s]+", "_", text)
+        text = self._UNSAFE_CHARS_RE.sub("", text)
+        text = self._WHITESPACE_RE.sub("_", text)
         return text.strip("_")
 
     def generate_yaml_frontmatter(self, apartment: ApartmentListing) -> str:
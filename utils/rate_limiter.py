@@ -0,0 +1,136 @@
+"""Async token bucket rate limiting for polite crawling."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative) or None if missing/unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket rate limiter for requests against a single host.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Every
+    request consumes one token, so callers only wait when they are actually
+    ahead of the allowed rate instead of sleeping a fixed delay after each
+    request.
+    """
+
+    __slots__ = ("rate", "burst", "min_rate", "_tokens", "_last_refill", "_paused_until", "_lock")
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float = 0.1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Allowed requests per second
+            burst: Maximum number of requests that may be issued back-to-back
+            min_rate: Lower bound for the rate when slowing down after throttling
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accumulated since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be issued and consume one token."""
+        async with self._lock:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def slow_down(self, factor: float = 0.5) -> None:
+        """
+        Reduce the request rate after the host signalled throttling.
+
+        Args:
+            factor: Multiplier applied to the current rate
+        """
+        self.rate = max(self.min_rate, self.rate * factor)
+        logger.warning(f"Rate limit reduced to {self.rate:.2f} requests/s")
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all requests to the host for a while.
+
+        Args:
+            seconds: Time from now before the next request may be issued
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        """
+        Adapt to rate limit hints sent by the host.
+
+        Honors `Retry-After` and pauses until `X-RateLimit-Reset` once
+        `X-RateLimit-Remaining` reaches zero.
+
+        Args:
+            headers: Response headers of the last request (any key case)
+
+        Returns:
+            Seconds the host asked us to wait, or None if it gave no hint
+        """
+        if not headers:
+            return None
+        headers = {key.lower(): value for key, value in headers.items()}
+
+        wait = parse_retry_after(headers.get("retry-after"))
+        if wait is None and headers.get("x-ratelimit-remaining", "").strip() == "0":
+            try:
+                reset = float(headers.get("x-ratelimit-reset", ""))
+            except ValueError:
+                reset = None
+            if reset is not None:
+                # Some hosts send an epoch timestamp instead of seconds left
+                wait = max(0.0, reset - time.time()) if reset > 1e9 else reset
+
+        if wait:
+            logger.warning(f"Host requested a pause of {wait:.1f}s")
+            self.pause(wait)
+        return wait
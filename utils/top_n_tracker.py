@@ -1,6 +1,7 @@
 """Efficient top-N apartment tracking using min-heap."""
 
 import heapq
+from itertools import count
 from typing import List, Tuple
 
 from models.apartment import ApartmentListing
@@ -13,10 +14,13 @@ class TopNTracker:
     Provides O(log N) insertion complexity for efficient real-time tracking
     of the best apartments without needing to sort all apartments.
 
-    The heap stores tuples of (negative_score, apartment) to create a
-    max-heap behavior (highest scores maintained).
+    The heap stores tuples of (score, sequence, apartment): the root is the
+    worst tracked apartment, so a better one replaces it in O(log N). The
+    insertion sequence breaks score ties, so apartments are never compared.
     """
 
+    __slots__ = ("n", "heap", "_sequence")
+
     def __init__(self, n: int):
         """
         Initialize tracker for top N apartments.
@@ -25,7 +29,8 @@ class TopNTracker:
             n: Number of top apartments to track
         """
         self.n = n
-        self.heap: List[Tuple[float, ApartmentListing]] = []
+        self.heap: List[Tuple[float, int, ApartmentListing]] = []
+        self._sequence = count()
 
     def add(self, apartment: ApartmentListing) -> bool:
         """
@@ -38,18 +43,17 @@ class TopNTracker:
             True if apartment made it into top N, False otherwise
         """
         score = apartment.investment_score or 0.0
+        entry = (score, next(self._sequence), apartment)
 
         if len(self.heap) < self.n:
             # Heap not full - always add
-            # Use negative score to create max-heap behavior
-            heapq.heappush(self.heap, (-score, apartment))
+            heapq.heappush(self.heap, entry)
             return True
         else:
-            # Check if better than worst in heap
-            worst_score = -self.heap[0][0]  # Negative of negative
-            if score > worst_score:
+            # Check if better than worst in heap (the root)
+            if score > self.heap[0][0]:
                 # Replace worst with new apartment
-                heapq.heapreplace(self.heap, (-score, apartment))
+                heapq.heapreplace(self.heap, entry)
                 return True
             return False
 
@@ -60,9 +64,9 @@ class TopNTracker:
         Returns:
             List of ApartmentListing objects sorted by investment_score descending
         """
-        # Sort by negative score (ascending = descending actual scores)
-        sorted_heap = sorted(self.heap, key=lambda x: x[0])
-        return [apt for _, apt in sorted_heap]
+        # Highest score first; ties keep insertion order
+        sorted_heap = sorted(self.heap, key=lambda entry: (-entry[0], entry[1]))
+        return [apt for _, _, apt in sorted_heap]
 
     def is_full(self) -> bool:
         """
@@ -82,7 +86,7 @@ class TopNTracker:
         """
         if not self.is_full():
             return float('-inf')
-        return -self.heap[0][0]
+        return self.heap[0][0]
 
     def __len__(self) -> int:
         """Return number of apartments currently tracked."""